@@ -5,6 +5,8 @@ This module provides the main conversion orchestration, bringing together
 all the modular components to convert JPK files to JSON format.
 """
 
+import os
+import sys
 import json
 import uuid
 import gzip
@@ -12,9 +14,13 @@ import zlib
 import base64
 import zipfile
 import xml.etree.ElementTree as ET
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 from ..config.loader import ConfigLoader
 from ..config.models import J2JConfig, TraceLogConfig
@@ -33,10 +39,116 @@ from ..generators.jpk_transformation_converter import JPKTransformationConverter
 from ..generators.operation_factory import OperationFactory
 from ..utils.constants import TARGET_VERSION, COMPONENT_ORDER
 from ..utils.exceptions import ConfigurationError, JPKParsingError
+from ..utils.json_compat import write_json_compact
 from ..utils.trace_logger import TraceLogger, VerbosityLevel
 from ..version import get_version_info, get_version_string
 
 
+@lru_cache(maxsize=None)
+def _load_discovery_module():
+    """Load jpk_discover_transformations.py (it lives next to the j2j package, not inside it)."""
+    import importlib.util
+    discovery_module_path = Path(__file__).parent.parent.parent / "jpk_discover_transformations.py"
+    spec = importlib.util.spec_from_file_location("jpk_discover", discovery_module_path)
+    discovery_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(discovery_module)
+    return discovery_module
+
+
+def _to_int(text: Optional[str]) -> Optional[int]:
+    """Convert JTR tag text to int, or None if it is not an integer (no exception raised)."""
+    if not text:
+        return None
+    text = text.strip()
+    digits = text[1:] if text[:1] in ('-', '+') else text
+    return int(text) if digits.isdecimal() else None
+
+
+# Salesforce functions whose Response transformation reads the SOAP response of the same WebServiceCall
+_SALESFORCE_NON_QUERY_FUNCTIONS = frozenset({'update', 'insert', 'delete', 'upsert'})
+
+
+def _is_flat_schema_document(schema_doc: Any) -> bool:
+    """Check the customSchemaIsFlat option of a schema document (Type 900 schemaTypeDocument or transformation document)."""
+    if not isinstance(schema_doc, dict):
+        return False
+    options = schema_doc.get('O')
+    return bool(options and options.get('customSchemaIsFlat', False))
+
+
+# Endpoint matching for Type 500 steps without a direct ID match.
+# Each activity is classified once into a kind; the kind selects an ordered list of
+# ((adapterId, functionName), take_first) lookups. take_first=False only accepts a unique candidate.
+_ENDPOINT_LOOKUP_PLANS = {
+    # NetSuite Function (type 232) -> netsuite + upsert (preferred endpoint is sorted first)
+    'netsuite_function': ((('netsuite', 'upsert'), True),),
+    # Source in a NetSuite operation: prioritize TempStorage to avoid multiple SOAP activities
+    # (Jitterbit rule: only one SOAP activity per operation), fall back to Salesforce Query
+    'netsuite_source': ((('tempstorage', 'tempstorage_read'), True), (('salesforce', 'query'), False)),
+    # Other sources: Salesforce Query first (common pattern), fall back to TempStorage read
+    'source': ((('salesforce', 'query'), False), (('tempstorage', 'tempstorage_read'), False)),
+    # Target activities are typically tempstorage write
+    # TODO: Improve matching logic to identify specific endpoint based on operation context
+    'target': ((('tempstorage', 'tempstorage_write'), True),),
+    # Salesforce Query (explicit Salesforce role, type 14 or "Web Service Call")
+    'salesforce_query': ((('salesforce', 'query'), False),),
+}
+_ENDPOINT_KIND_BY_TYPE = {'232': 'netsuite_function', '14': 'salesforce_query'}
+_ENDPOINT_KIND_BY_ROLE = {'source': 'source', 'target': 'target', 'web service call': 'salesforce_query'}
+
+
+def _endpoint_kind(role_lc: str, type_str: str) -> Optional[str]:
+    """Classify an activity (lowercased role, string type) into an _ENDPOINT_LOOKUP_PLANS kind."""
+    if type_str == '232' or ('netsuite' in role_lc and 'function' in role_lc):
+        return 'netsuite_function'
+    kind = _ENDPOINT_KIND_BY_ROLE.get(role_lc) or _ENDPOINT_KIND_BY_TYPE.get(type_str)
+    if kind is None and 'salesforce' in role_lc:
+        kind = 'salesforce_query'
+    return kind
+
+
+@dataclass
+class OperationIndex:
+    """Step-order lookups over converted Type 200 operations, built in a single pass over all steps."""
+    # IDs of transformations (Type 700) that are the first step of an operation
+    first_step_transform_ids: set = field(default_factory=set)
+    # Transformation ID -> (operation, ID of the closest Type 400/500 step before it or None)
+    # When a transformation appears in several operations, the last occurrence wins
+    activity_before_transform: Dict[str, Tuple[Dict[str, Any], Optional[str]]] = field(default_factory=dict)
+
+    @classmethod
+    def from_operations(cls, operations: List[Dict[str, Any]]) -> 'OperationIndex':
+        """
+        Build the index from converted operations.
+
+        Args:
+            operations: List of Type 200 operation components (with final step IDs)
+
+        Returns:
+            OperationIndex for the operations
+        """
+        index = cls()
+        for operation in operations:
+            steps = operation.get('steps', [])
+            if steps:
+                first_step = steps[0]
+                first_step_id = first_step.get('id')
+                # Only mark transformations (type 700) as first step
+                if first_step.get('type') == 700 and first_step_id:
+                    index.first_step_transform_ids.add(first_step_id)
+            last_activity_id = None
+            for step in steps:
+                step_type = step.get('type')
+                # Type 500 (endpoint/activity) or Type 400 (script) steps feed the transformations after them
+                if step_type in (400, 500):
+                    last_activity_id = step.get('id')
+                elif step_type == 700:  # Transformation step
+                    transform_id = step.get('id')
+                    if transform_id:
+                        index.activity_before_transform[transform_id] = (operation, last_activity_id)
+        return index
+
+
 class JPKConverter:
     """
     Main JPK to JSON converter class.
@@ -107,7 +219,6 @@ class JPKConverter:
         Raises:
             JPKParsingError: If JPK file cannot be parsed
         """
-        import os
         from ..parsers.xml_parser import XMLParser
 
         xml_parser = XMLParser()
@@ -484,13 +595,14 @@ class JPKConverter:
         # This must be done AFTER operations are converted so we can check step order
         # Validation requires: if transformation has source schema, it must not be first step (main-EBGGZ3NW.js:115864-115878)
         # This fixes "OperationSourceActivityIsRequired" error for Query Contacts operation
-        self._remove_source_from_first_step_transformations(transformations, operations)
+        operation_index = OperationIndex.from_operations(operations)
+        self._remove_source_from_first_step_transformations(transformations, operation_index)
         
         # CRITICAL FIX (December 17, 2025): Update source.origin.id in transformations to point to correct activity IDs
         # After operations are converted, JPK activity IDs in origin.id need to be mapped to new endpoint/activity IDs
         # Validation expects source.origin.id === activity.id for the activity that appears before the transformation
         # This must be done AFTER operations are converted so we have the final step IDs
-        self._update_transformation_origin_ids(transformations, operations)
+        self._update_transformation_origin_ids(transformations, operation_index)
 
         return {
             'project_variables': project_variables,
@@ -529,18 +641,8 @@ class JPKConverter:
         if self.trace_logger:
             self.trace_logger.log_decision("Checking for embedded connector schemas (name-based deduplication)", {"transformation_count": len(transformations)})
         
-        # Get JPK transformation data with field structures using the discovery script
-        import sys
-        from pathlib import Path
-        
-        # Import the jpk_discover_transformations module
-        discovery_module_path = Path(__file__).parent.parent.parent / "jpk_discover_transformations.py"
-        spec = __import__('importlib.util').util.spec_from_file_location("jpk_discover", discovery_module_path)
-        discovery_module = __import__('importlib.util').util.module_from_spec(spec)
-        spec.loader.exec_module(discovery_module)
-        
-        # Get transformations with field structures
-        jpk_transformations = discovery_module.discover_transformations(jpk_path)
+        # Get JPK transformation data with field structures using the discovery module
+        jpk_transformations = _load_discovery_module().discover_transformations(jpk_path)
         
         schemas = []
         # Initialize with schemas already created from XSD assets to prevent duplicates
@@ -957,7 +1059,7 @@ class JPKConverter:
         #   - Flat schemas: format="csv", metadataVersion="3.0.1" (regardless of connector/user)
         is_connector_schema = bool(origin_id and adapter_id)
         # Check if schema is flat from document structure (not from JPK, so use direct check)
-        schema_is_flat = schema_document.get('O', {}).get('customSchemaIsFlat', False) if isinstance(schema_document, dict) else False
+        schema_is_flat = _is_flat_schema_document(schema_document)
         
         # Use rule-based format determination
         schema_format, metadata_version = get_schema_format(schema_is_flat, is_connector_schema)
@@ -1047,12 +1149,8 @@ class JPKConverter:
                 jtr_xml = gzip.decompress(raw_gz)
                 decompressed_size = len(jtr_xml)
                 
-                # ZLIB compress (level 9 for maximum compression)
-                zlib_compressed = zlib.compress(jtr_xml, level=9)
-                zlib_size = len(zlib_compressed)
-                
-                # Base64 encode
-                jtr_b64 = base64.b64encode(zlib_compressed).decode('utf-8')
+                # ZLIB compress (level 9) + base64 encode
+                jtr_b64, zlib_size = self._encode_jtr_xml(jtr_xml)
                 b64_len = len(jtr_b64)
                 
                 # Log successful extraction
@@ -1138,10 +1236,8 @@ class JPKConverter:
         # Parse MN (minOccurs) - convert to int, default 0
         mn_elem = element.find('MN')
         if mn_elem is not None and mn_elem.text:
-            try:
-                result['MN'] = int(mn_elem.text)
-            except ValueError:
-                result['MN'] = 0
+            mn_value = _to_int(mn_elem.text)
+            result['MN'] = mn_value if mn_value is not None else 0
         
         # Parse MX (maxOccurs) - keep as "unbounded" string or convert to int
         mx_elem = element.find('MX')
@@ -1149,10 +1245,8 @@ class JPKConverter:
             if mx_elem.text.lower() == 'unbounded':
                 result['MX'] = 'unbounded'
             else:
-                try:
-                    result['MX'] = int(mx_elem.text)
-                except ValueError:
-                    result['MX'] = 1
+                mx_value = _to_int(mx_elem.text)
+                result['MX'] = mx_value if mx_value is not None else 1
         
         # Parse T (type) - optional
         t_elem = element.find('T')
@@ -1181,35 +1275,31 @@ class JPKConverter:
         
         # Parse I (index) - optional int
         i_elem = element.find('I')
-        if i_elem is not None and i_elem.text:
-            try:
-                result['I'] = int(i_elem.text)
-            except ValueError:
-                pass
+        if i_elem is not None:
+            i_value = _to_int(i_elem.text)
+            if i_value is not None:
+                result['I'] = i_value
         
         # Parse L (level) - optional int
         l_elem = element.find('L')
-        if l_elem is not None and l_elem.text:
-            try:
-                result['L'] = int(l_elem.text)
-            except ValueError:
-                pass
+        if l_elem is not None:
+            l_value = _to_int(l_elem.text)
+            if l_value is not None:
+                result['L'] = l_value
         
         # Parse BG (begin) - optional int
         bg_elem = element.find('BG')
-        if bg_elem is not None and bg_elem.text:
-            try:
-                result['BG'] = int(bg_elem.text)
-            except ValueError:
-                pass
+        if bg_elem is not None:
+            bg_value = _to_int(bg_elem.text)
+            if bg_value is not None:
+                result['BG'] = bg_value
         
         # Parse EN (end) - optional int
         en_elem = element.find('EN')
-        if en_elem is not None and en_elem.text:
-            try:
-                result['EN'] = int(en_elem.text)
-            except ValueError:
-                pass
+        if en_elem is not None:
+            en_value = _to_int(en_elem.text)
+            if en_value is not None:
+                result['EN'] = en_value
         
         # Parse child elements recursively
         children = []
@@ -1297,45 +1387,64 @@ class JPKConverter:
             count += self._count_schema_elements(child)
         return count
 
-    def _read_jtr_cache_raw(self, jpk_path: str, activity_id: str, direction: str) -> Optional[bytes]:
+    @staticmethod
+    def _encode_jtr_xml(jtr_xml: bytes) -> Tuple[str, int]:
         """
-        Read JTR XML from cache file without base64/zlib conversion.
-        Returns raw decompressed XML bytes.
-        
+        Encode raw JTR XML the way the JSON format stores it: ZLIB (level 9) + base64.
+
+        Returns:
+            Tuple of (base64 string, zlib-compressed size)
+        """
+        zlib_compressed = zlib.compress(jtr_xml, level=9)
+        return base64.b64encode(zlib_compressed).decode('utf-8'), len(zlib_compressed)
+
+    def _load_jtr_cache_schemas(self, jpk_path: str, cache_keys: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Tuple[Dict[str, Any], str]]:
+        """
+        Read, decompress and parse the JTR cache files for several activities at once.
+
+        The ZIP is opened and its file list indexed once for the whole batch. A cache
+        file that cannot be read or decompressed is skipped; the others still load.
+
         Args:
             jpk_path: Path to the JPK ZIP file
-            activity_id: The activity ID (UUID)
-            direction: 'input' or 'output'
-            
+            cache_keys: List of (activity_id, direction) pairs to load
+
         Returns:
-            Raw JTR XML bytes, or None if not found/error
+            Mapping of (activity_id, direction) -> (schema root, base64 JTR) for every
+            cache file that was found and parsed
         """
-        if not jpk_path or not activity_id or not direction:
-            return None
-        
-        cache_filename = f"{activity_id}_{direction}.gz"
-        
+        if not jpk_path or not cache_keys:
+            return {}
+
+        xml_by_key = {}
         try:
             with zipfile.ZipFile(jpk_path, 'r') as jpk:
-                # Find cache file
-                cache_path = None
-                for file_info in jpk.filelist:
-                    if file_info.filename.endswith(f"cache/ConnectorCallStructures/{cache_filename}"):
-                        cache_path = file_info.filename
-                        break
-                
-                if not cache_path:
-                    return None
-                
-                # Read and decompress
-                raw_gz = jpk.read(cache_path)
-                jtr_xml = gzip.decompress(raw_gz)
-                
-                return jtr_xml
-                
+                # Index cache files by filename (project folder name varies)
+                cache_paths = {}
+                for filename in jpk.namelist():
+                    folder, _, cache_filename = filename.rpartition('/')
+                    if folder.endswith('cache/ConnectorCallStructures') and cache_filename not in cache_paths:
+                        cache_paths[cache_filename] = filename
+
+                for activity_id, direction in cache_keys:
+                    cache_filename = f"{activity_id}_{direction}.gz"
+                    cache_path = cache_paths.get(cache_filename)
+                    if not cache_path:
+                        continue
+                    try:
+                        xml_by_key[(activity_id, direction)] = gzip.decompress(jpk.read(cache_path))
+                    except Exception as e:
+                        print(f"         ⚠️ JTR cache read failed: {cache_filename} - {e}")
         except Exception as e:
-            print(f"         ⚠️ JTR cache read failed: {cache_filename} - {e}")
-            return None
+            print(f"         ⚠️ JTR cache read failed: {jpk_path} - {e}")
+            return {}
+
+        schemas = {}
+        for key, jtr_xml in xml_by_key.items():
+            schema = self._parse_jtr_xml_to_schema(jtr_xml)
+            if schema:
+                schemas[key] = (schema, self._encode_jtr_xml(jtr_xml)[0])
+        return schemas
 
     def _generate_activity_schema_o_field(self, activity: Dict[str, Any], direction: str, 
                                            root_element_name: str, root_namespace: str = None) -> Dict[str, Any]:
@@ -1446,6 +1555,22 @@ class JPKConverter:
         
         print(f"   📊 Found {len(schema_map)} Type 900 schemas (by origin_id) and {len(schema_map_by_adapter)} (by adapter) for activity mapping")
         
+        # Collect activity directions with no matching Type 900 schema and load their
+        # JTR caches in one batch (one pass over the ZIP)
+        fallback_keys = []
+        for component in components:
+            if component.get('type') != 500 or not component.get('adapterId') or not component.get('id'):
+                continue
+            adapter_id = component['adapterId']
+            function_name = component.get('functionName', '')
+            for direction in ('input', 'output'):
+                if (component['id'], direction) in schema_map:
+                    continue
+                if function_name and (adapter_id.lower(), function_name.lower(), direction) in schema_map_by_adapter:
+                    continue
+                fallback_keys.append((component['id'], direction))
+        cached_schemas = self._load_jtr_cache_schemas(jpk_path, fallback_keys)
+        
         activities_processed = 0
         activities_with_schemas = 0
         
@@ -1483,130 +1608,35 @@ class JPKConverter:
             schemas_added = False
             function_name = component.get('functionName', '')
             
-            # Try to populate INPUT field from Type 900 schema
-            # First try by ID (for backwards compatibility)
-            input_key = (activity_id, 'input')
-            schema_doc = None
-            if input_key in schema_map:
-                schema_doc = schema_map[input_key]
-            elif function_name:
-                # Try matching by (adapterId, functionName, direction)
-                adapter_input_key = (adapter_id.lower(), function_name.lower(), 'input')
-                if adapter_input_key in schema_map_by_adapter:
-                    schema_doc = schema_map_by_adapter[adapter_input_key]
-                    if self.trace_logger:
-                        self.trace_logger.log_decision(
-                            f"Input schema matched by adapter properties: {activity_name}",
-                            {"adapter_id": adapter_id, "function_name": function_name, "direction": "input"},
-                            VerbosityLevel.DETAILED
-                        )
-            
-            if schema_doc:
-                root_elem = schema_doc.get('root', {})
-                root_name = root_elem.get('N', '') if root_elem else ''
-                root_ns = root_elem.get('NS', '') if root_elem else ''
-                
-                # Generate O field if not present (connector schemas filter out O from schemaTypeDocument)
-                o_field = schema_doc.get('O')
-                if not o_field and root_name:
-                    o_field = self._generate_activity_schema_o_field(component, 'input', root_name, root_ns)
-                
-                component['input'] = {
-                    'root': root_elem
-                }
-                if o_field:
-                    component['input']['O'] = o_field
-                if 'jtr' in schema_doc:
-                    component['input']['jtr'] = schema_doc['jtr']
-                schemas_added = True
-                print(f"         ✅ Input schema added to: {activity_name}")
-                if self.trace_logger:
-                    self.trace_logger.log_decision(
-                        f"Input schema copied from Type 900: {activity_name}",
-                        {"has_O": 'O' in component['input'], "has_root": 'root' in component['input'], "has_jtr": 'jtr' in component.get('input', {})},
-                        VerbosityLevel.DETAILED
-                    )
-            else:
-                # Fallback: Try to extract JTR from cache and build schema
-                input_jtr_xml = self._read_jtr_cache_raw(jpk_path, activity_id, 'input')
-                if input_jtr_xml:
-                    input_schema = self._parse_jtr_xml_to_schema(input_jtr_xml)
-                    if input_schema:
-                        root_name = input_schema.get('N', '')
-                        root_ns = input_schema.get('NS', '')
-                        input_o = self._generate_activity_schema_o_field(component, 'input', root_name, root_ns)
-                        # Also get the jtr base64 version
-                        jtr_b64 = self._extract_jtr_from_cache(jpk_path, activity_id, 'input')
-                        component['input'] = {'O': input_o, 'root': input_schema}
-                        if jtr_b64:
-                            component['input']['jtr'] = jtr_b64
-                        schemas_added = True
-                        print(f"         ✅ Input schema (from cache) added to: {activity_name}")
-            
-            # Try to populate OUTPUT field from Type 900 schema
-            # First try by ID (for backwards compatibility)
-            output_key = (activity_id, 'output')
-            schema_doc = None
-            if output_key in schema_map:
-                schema_doc = schema_map[output_key]
-            elif function_name:
-                # Try matching by (adapterId, functionName, direction)
-                adapter_output_key = (adapter_id.lower(), function_name.lower(), 'output')
-                if adapter_output_key in schema_map_by_adapter:
-                    schema_doc = schema_map_by_adapter[adapter_output_key]
-                    if self.trace_logger:
+            for direction in ('input', 'output'):
+                # Try to populate the field from a Type 900 schema
+                # First try by ID (for backwards compatibility)
+                schema_doc = schema_map.get((activity_id, direction))
+                if not schema_doc and function_name:
+                    # Try matching by (adapterId, functionName, direction)
+                    schema_doc = schema_map_by_adapter.get((adapter_id.lower(), function_name.lower(), direction))
+                    if schema_doc and self.trace_logger:
                         self.trace_logger.log_decision(
-                            f"Output schema matched by adapter properties: {activity_name}",
-                            {"adapter_id": adapter_id, "function_name": function_name, "direction": "output"},
+                            f"{direction.capitalize()} schema matched by adapter properties: {activity_name}",
+                            {"adapter_id": adapter_id, "function_name": function_name, "direction": direction},
                             VerbosityLevel.DETAILED
                         )
-            
-            if schema_doc:
-                root_elem = schema_doc.get('root', {})
-                root_name = root_elem.get('N', '') if root_elem else ''
-                root_ns = root_elem.get('NS', '') if root_elem else ''
                 
-                # Generate O field if not present (connector schemas filter out O from schemaTypeDocument)
-                o_field = schema_doc.get('O')
-                if not o_field:
-                    # Always generate O field for connector schemas, even if root_name is empty
-                    # This ensures the output field structure is complete
-                    if root_name or root_elem:  # Only generate if we have some structure
-                        o_field = self._generate_activity_schema_o_field(component, 'output', root_name or 'root', root_ns)
+                if schema_doc:
+                    self._apply_schema_doc(component, direction, schema_doc)
+                    schemas_added = True
+                    continue
                 
-                # Create output field structure
-                component['output'] = {
-                    'root': root_elem if root_elem else {}
-                }
-                if o_field:
-                    component['output']['O'] = o_field
-                if 'jtr' in schema_doc:
-                    component['output']['jtr'] = schema_doc['jtr']
-                schemas_added = True
-                print(f"         ✅ Output schema added to: {activity_name} (root: {bool(root_elem)}, O: {bool(o_field)})")
-                if self.trace_logger:
-                    self.trace_logger.log_decision(
-                        f"Output schema copied from Type 900: {activity_name}",
-                        {"has_O": 'O' in component['output'], "has_root": 'root' in component['output'], 
-                         "has_jtr": 'jtr' in component.get('output', {}), "root_keys": list(root_elem.keys()) if root_elem else []},
-                        VerbosityLevel.DETAILED
-                    )
-            else:
-                # Fallback: Try to extract JTR from cache and build schema
-                output_jtr_xml = self._read_jtr_cache_raw(jpk_path, activity_id, 'output')
-                if output_jtr_xml:
-                    output_schema = self._parse_jtr_xml_to_schema(output_jtr_xml)
-                    if output_schema:
-                        root_name = output_schema.get('N', '')
-                        root_ns = output_schema.get('NS', '')
-                        output_o = self._generate_activity_schema_o_field(component, 'output', root_name, root_ns)
-                        # Also get the jtr base64 version
-                        jtr_b64 = self._extract_jtr_from_cache(jpk_path, activity_id, 'output')
-                        component['output'] = {'O': output_o, 'root': output_schema}
-                        if jtr_b64:
-                            component['output']['jtr'] = jtr_b64
-                        schemas_added = True
-                        print(f"         ✅ Output schema (from cache) added to: {activity_name}")
+                # Fallback: Use the schema built from the JTR cache (loaded above)
+                cached = cached_schemas.get((activity_id, direction))
+                if cached:
+                    cached_schema, jtr_b64 = cached
+                    root_name = cached_schema.get('N', '')
+                    root_ns = cached_schema.get('NS', '')
+                    o_field = self._generate_activity_schema_o_field(component, direction, root_name, root_ns)
+                    component[direction] = {'O': o_field, 'root': cached_schema, 'jtr': jtr_b64}
+                    schemas_added = True
+                    print(f"         ✅ {direction.capitalize()} schema (from cache) added to: {activity_name}")
             
             if schemas_added:
                 activities_with_schemas += 1
@@ -1619,6 +1649,45 @@ class JPKConverter:
                 VerbosityLevel.NORMAL
             )
 
+    def _apply_schema_doc(self, component: Dict[str, Any], direction: str, schema_doc: Dict[str, Any]) -> None:
+        """
+        Copy a Type 900 schemaTypeDocument into an activity's input or output field.
+        
+        Args:
+            component: The Type 500 activity component (modified in place)
+            direction: 'input' or 'output'
+            schema_doc: The matching Type 900 schemaTypeDocument
+        """
+        root_elem = schema_doc.get('root') or {}
+        root_name = root_elem.get('N', '')
+        root_ns = root_elem.get('NS', '')
+        
+        # Generate O field if not present (connector schemas filter out O from schemaTypeDocument)
+        o_field = schema_doc.get('O')
+        if not o_field:
+            # Output always gets an O field when there is some structure, even if root_name is empty
+            if direction == 'output' and root_elem:
+                root_name = root_name or 'root'
+            if root_name:
+                o_field = self._generate_activity_schema_o_field(component, direction, root_name, root_ns)
+        
+        schema_field = {'root': root_elem}
+        if o_field:
+            schema_field['O'] = o_field
+        if 'jtr' in schema_doc:
+            schema_field['jtr'] = schema_doc['jtr']
+        component[direction] = schema_field
+        
+        activity_name = component.get('name', 'Unknown')
+        print(f"         ✅ {direction.capitalize()} schema added to: {activity_name} (root: {bool(root_elem)}, O: {bool(o_field)})")
+        if self.trace_logger:
+            self.trace_logger.log_decision(
+                f"{direction.capitalize()} schema copied from Type 900: {activity_name}",
+                {"has_O": 'O' in schema_field, "has_root": True, "has_jtr": 'jtr' in schema_field,
+                 "root_keys": list(root_elem.keys())},
+                VerbosityLevel.DETAILED
+            )
+
     def _merge_components(self, baseline: Dict[str, Any], components: Dict[str, Any]) -> Dict[str, Any]:
         """
         Merge extracted components with baseline.
@@ -1725,6 +1794,14 @@ class JPKConverter:
             for c in components.get('operations', [])
         }
         
+        # Build the operation references for sync workflows once, outside the workflow loop
+        # Workflow entries stay as {'id', 'type'} dicts (baseline workflow format); they are only read
+        all_converted_ops = [
+            {'id': op['id'], 'type': 200}
+            for op in components.get('operations', [])
+            if op.get('id') and op.get('name')
+        ]
+
         # Update workflows to use converted operation IDs
         workflows = baseline.get('project', {}).get('workflows', [])
         for workflow in workflows:
@@ -1733,18 +1810,7 @@ class JPKConverter:
             # For the main sync workflow, include ALL converted operations
             # This ensures "Test Email" and all other operations are included
             if 'sync-salesforce' in workflow_name or 'sync' in workflow_name:
-                # Build list of all converted operations
-                all_converted_ops = []
-                for op in components.get('operations', []):
-                    op_id = op.get('id')
-                    op_name = op.get('name')
-                    if op_id and op_name:
-                        all_converted_ops.append({
-                            'id': op_id,
-                            'type': 200
-                        })
-                
-                workflow['operations'] = all_converted_ops
+                workflow['operations'] = list(all_converted_ops)
                 print(f"   ✅ Updated workflow '{workflow.get('name')}' with {len(all_converted_ops)} operations (all converted operations included)")
             else:
                 # For other workflows, try to map by name
@@ -1798,17 +1864,19 @@ class JPKConverter:
         unique_name = f"JPK-{TARGET_VERSION}-Modular-{str(uuid.uuid4())[:8]}"
         baseline['project']['name'] = unique_name
 
-        # Log summary
-        print(f"   Added {len(components['project_variables'])} Project Variables (Type 1000)")
-        print(f"   Added {len(components['global_variables'])} Global Variables (Type 1300)")
-        print(f"   Added {len(components['type_500_endpoints'])} Type 500 Endpoints")
-        print(f"   Added {len(components['type_600_endpoints'])} Type 600 Endpoints")
-        print(f"   Added {len(components.get('type_400_scripts', []))} Scripts (Type 400)")
-        print(f"   Added {len(components.get('operations', []))} Operations (Type 200)")
-        print(f"   Added {len(components['transformations'])} Transformations (Type 700)")
-        print(f"   Added {len(components['schema_components'])} Schema Document Components (Type 900)")
-        print(f"   Added {len(components['xsd_assets'])} XSD Assets")
-        print(f"   📊 Total components: {len(ordered_components)}")
+        # Log summary (single print: one write instead of ten)
+        print("\n".join([
+            f"   Added {len(components['project_variables'])} Project Variables (Type 1000)",
+            f"   Added {len(components['global_variables'])} Global Variables (Type 1300)",
+            f"   Added {len(components['type_500_endpoints'])} Type 500 Endpoints",
+            f"   Added {len(components['type_600_endpoints'])} Type 600 Endpoints",
+            f"   Added {len(components.get('type_400_scripts', []))} Scripts (Type 400)",
+            f"   Added {len(components.get('operations', []))} Operations (Type 200)",
+            f"   Added {len(components['transformations'])} Transformations (Type 700)",
+            f"   Added {len(components['schema_components'])} Schema Document Components (Type 900)",
+            f"   Added {len(components['xsd_assets'])} XSD Assets",
+            f"   📊 Total components: {len(ordered_components)}"
+        ]))
 
         return baseline
 
@@ -1822,35 +1890,9 @@ class JPKConverter:
         Returns:
             List of transformation components
         """
-        import subprocess
-        import tempfile
-        import os
-        
         try:
-            # Create temporary file for JPK discovery output
-            temp_fd, temp_path = tempfile.mkstemp(suffix='.json')
-            os.close(temp_fd)
-            
-            # Run JPK discovery tool
-            discovery_script = Path(__file__).parent.parent.parent / 'jpk_discover_transformations.py'
-            
-            result = subprocess.run(
-                ['python', str(discovery_script), jpk_path, temp_path],
-                capture_output=True,
-                text=True,
-                check=False
-            )
-            
-            if result.returncode != 0:
-                print(f"   ⚠️  JPK discovery failed: {result.stderr}")
-                return []
-            
-            # Load discovery data
-            with open(temp_path, 'r') as f:
-                discovery_data = json.load(f)
-            
-            # Clean up temp file
-            os.unlink(temp_path)
+            # Run JPK discovery in-process
+            discovery_data = _load_discovery_module().build_discovery_output(jpk_path)
             
             # Convert transformations using the converter
             transformations = self.transformation_converter.convert_transformations_from_jpk_discovery(
@@ -1896,212 +1938,206 @@ class JPKConverter:
         # Build mapping from JPK transformation ID to new JSON transformation ID
         # Also build set of content_ids that exist as Type 700 components (for skipping Request transformations)
         jpk_id_to_json_id = {}
-        existing_transformation_content_ids = set()  # Set of content_ids that exist as Type 700 components
         for trans in transformations:
-            metadata = trans.get('_conversion_metadata', {})
-            original_jpk_id = metadata.get('original_jpk_id')
+            original_jpk_id = trans.get('_conversion_metadata', {}).get('original_jpk_id')
             if original_jpk_id:
                 jpk_id_to_json_id[original_jpk_id] = trans.get('id')
-                existing_transformation_content_ids.add(original_jpk_id)
+        # Set of content_ids that exist as Type 700 components (the keys of the map above)
+        existing_transformation_content_ids = set(jpk_id_to_json_id)
+        
+        # Build endpoint lookup maps for matching (once, shared by all operations)
+        # Map by (adapterId, functionName) -> list of endpoints (for disambiguation)
+        # Name tags used for preference ordering are computed once per endpoint (keyed by object identity,
+        # since endpoints are emitted as-is and must not carry extra fields)
+        endpoint_by_adapter_func = defaultdict(list)
+        has_old_suffix = {}
+        is_canonical_or_contact = {}
+        for endpoint in type_500_endpoints:
+            # Intern the key strings so lookups with the _ENDPOINT_LOOKUP_PLANS literals hit the identity fast path
+            adapter_id = endpoint.get('adapterId', '')
+            function_name = endpoint.get('functionName', '')
+            if isinstance(adapter_id, str):
+                adapter_id = sys.intern(adapter_id)
+            if isinstance(function_name, str):
+                function_name = sys.intern(function_name)
+            endpoint_by_adapter_func[(adapter_id, function_name)].append(endpoint)
+            name = endpoint.get('name') or ''
+            name_lc = name.lower()
+            has_old_suffix[id(endpoint)] = '_old' in name
+            is_canonical_or_contact[id(endpoint)] = 'canonical' in name_lc or 'contact' in name_lc
+        
+        # Order candidates by preference so the preferred endpoint is at index 0 (stable sort keeps JPK order otherwise)
+        # NetSuite upsert: prefer endpoint without '_old' suffix
+        # TempStorage read: prefer one with "Canonical" or "Contact" in name (reads canonical contact data)
+        netsuite_upserts = endpoint_by_adapter_func.get(('netsuite', 'upsert'))
+        if netsuite_upserts:
+            netsuite_upserts.sort(key=lambda e: has_old_suffix[id(e)])
+        tempstorage_reads = endpoint_by_adapter_func.get(('tempstorage', 'tempstorage_read'))
+        if tempstorage_reads:
+            tempstorage_reads.sort(key=lambda e: not is_canonical_or_contact[id(e)])
+        
+        # Map by ID for direct lookups
+        endpoint_by_id = {e.get('id'): e for e in type_500_endpoints}
+        
+        # Build mapping from script component ID (content_id) to script component
+        # Scripts now use content_id as component ID for RunScript() compatibility
+        script_by_id = {s.get('id'): s for s in (type_400_scripts or [])}
         
         for jpk_op in jpk_operations:
-            try:
-                operation = self.operation_factory.create_operation(
-                    operation_id=jpk_op['id'],
-                    operation_name=jpk_op['name'],
-                    activities=jpk_op.get('activities', []),
-                    properties=jpk_op.get('properties', {}),
-                    failure_operation_id=jpk_op.get('failure_operation_id'),
-                    existing_transformation_ids=existing_transformation_content_ids
-                )
-                
-                # Build endpoint lookup maps for matching
-                # Map by (adapterId, functionName) -> list of endpoints (for disambiguation)
-                endpoint_by_adapter_func = {}
-                for endpoint in type_500_endpoints:
-                    adapter = endpoint.get('adapterId', '')
-                    func = endpoint.get('functionName', '')
-                    key = (adapter, func)
-                    if key not in endpoint_by_adapter_func:
-                        endpoint_by_adapter_func[key] = []
-                    endpoint_by_adapter_func[key].append(endpoint)
-                
-                # Map by ID for direct lookups
-                endpoint_by_id = {e.get('id'): e for e in type_500_endpoints}
-                
-                # Build mapping from script component ID (content_id) to script component
-                # Scripts now use content_id as component ID for RunScript() compatibility
-                script_by_id = {s.get('id'): s for s in (type_400_scripts or [])}
-                
-                # Update step IDs to match converted component IDs
-                # For Type 700 steps (transformations), map JPK content_id to new transformation ID
-                # For Type 500 steps (endpoints), match by adapter+function or keep original ID
-                updated_steps = []
+            operation = self._convert_one_operation(
+                jpk_op, jpk_id_to_json_id, existing_transformation_content_ids,
+                endpoint_by_adapter_func, endpoint_by_id, script_by_id, activity_id_to_content_id
+            )
+            if operation is not None:
+                operations.append(operation)
+        
+        return operations
+
+    def _convert_one_operation(
+        self,
+        jpk_op: Dict[str, Any],
+        jpk_id_to_json_id: Dict[str, str],
+        existing_transformation_content_ids: set,
+        endpoint_by_adapter_func: Dict[tuple, List[Dict[str, Any]]],
+        endpoint_by_id: Dict[str, Dict[str, Any]],
+        script_by_id: Dict[str, Dict[str, Any]],
+        activity_id_to_content_id: Optional[Dict[str, str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Convert a single JPK operation to a Type 200 operation, mapping its step IDs.
+        
+        Args:
+            jpk_op: JPK operation dictionary
+            jpk_id_to_json_id: Mapping from JPK transformation ID to JSON transformation ID
+            existing_transformation_content_ids: Content IDs that exist as Type 700 components
+            endpoint_by_adapter_func: (adapterId, functionName) -> preference-ordered endpoints
+            endpoint_by_id: Endpoint ID -> Type 500 endpoint
+            script_by_id: Script component ID (content_id) -> Type 400 script
+            activity_id_to_content_id: Mapping from activity_id to content_id for script step mapping
+            
+        Returns:
+            Type 200 operation component, or None if the operation could not be converted
+        """
+        try:
+            operation = self.operation_factory.create_operation(
+                operation_id=jpk_op['id'],
+                operation_name=jpk_op['name'],
+                activities=jpk_op.get('activities', []),
+                properties=jpk_op.get('properties', {}),
+                failure_operation_id=jpk_op.get('failure_operation_id'),
+                existing_transformation_ids=existing_transformation_content_ids
+            )
+            
+            # Update step IDs to match converted component IDs (in place; create_operation returns fresh steps)
+            # For Type 700 steps (transformations), map JPK content_id to new transformation ID
+            # For Type 500 steps (endpoints), match by adapter+function or keep original ID
+            steps = operation['steps']
+            step_warnings = []  # Collected per operation, printed once after the step loop
+            
+            # Get the original activity data for this operation to help with matching
+            # Create a map: step index -> activity (for endpoint/script steps only)
+            jpk_activities = jpk_op.get('activities', [])
+            step_to_activity_map = {}  # Maps step index to activity index
+            
+            # Endpoint kind per activity, parallel to jpk_activities (the input activity dicts are not modified)
+            activity_kinds = [
+                _endpoint_kind((a.get('role') or '').lower(), str(a.get('type', '')))
+                for a in jpk_activities
+            ]
+            
+            # Whether this is a NetSuite operation (has a NetSuite Function activity)
+            # Role can be "NetSuite Function" (with capital letters and space)
+            is_netsuite_operation = 'netsuite_function' in activity_kinds
+            
+            # Index activities by activity_id (first occurrence wins)
+            activity_id_to_idx = {}
+            for act_idx, activity in enumerate(jpk_activities):
+                activity_id_to_idx.setdefault(activity.get('activity_id'), act_idx)
+            
+            # Build mapping: for each endpoint/script step, find corresponding activity
+            # by matching the step_id (which is activity_id) with activity's activity_id
+            for step_idx, step in enumerate(steps):
+                # Only map endpoint and script steps to activities
+                if step.get('type') in (400, 500):
+                    act_idx = activity_id_to_idx.get(step.get('id'))
+                    if act_idx is not None:
+                        step_to_activity_map[step_idx] = act_idx
+            
+            for step_idx, step in enumerate(steps):
+                step_id = step.get('id')
+                step_type = step.get('type')
                 
-                # Get the original activity data for this operation to help with matching
-                # Create a map: step index -> activity (for endpoint/script steps only)
-                jpk_activities = jpk_op.get('activities', [])
-                activity_to_step_map = {}  # Maps activity index to step index
-                step_to_activity_map = {}  # Maps step index to activity index
+                # For transformations (Type 700), map JPK content_id to new transformation ID
+                if step_type == 700 and step_id:
+                    # step_id is the JPK content_id (original transformation ID from JPK)
+                    # Map it to the new JSON transformation ID
+                    mapped_id = jpk_id_to_json_id.get(step_id)
+                    if mapped_id:
+                        step['id'] = mapped_id
+                    else:
+                        step_warnings.append(f"      - Could not map transformation step ID {step_id[:8]}... to new transformation ID")
                 
-                # Build mapping: for each endpoint/script step, find corresponding activity
-                # by matching the step_id (which is activity_id) with activity's activity_id
-                for step_idx, step in enumerate(operation.get('steps', [])):
-                    step_id = step.get('id')
-                    step_type = step.get('type')
+                # For endpoints (Type 500), match by adapter+function or direct ID
+                elif step_type == 500 and step_id:
+                    # Try direct ID match first
+                    matching_endpoint = endpoint_by_id.get(step_id)
                     
-                    # Only map endpoint and script steps to activities
-                    if step_type in [400, 500]:
-                        for act_idx, activity in enumerate(jpk_activities):
-                            if activity.get('activity_id') == step_id:
-                                step_to_activity_map[step_idx] = act_idx
-                                break
+                    if not matching_endpoint:
+                        # Try to match by adapter + function based on activity role
+                        activity_idx = step_to_activity_map.get(step_idx)
+                        if activity_idx is not None and activity_idx < len(jpk_activities):
+                            activity = jpk_activities[activity_idx]
+                            kind = activity_kinds[activity_idx]
+                            if kind == 'source' and is_netsuite_operation:
+                                kind = 'netsuite_source'
+                            
+                            for key, take_first in _ENDPOINT_LOOKUP_PLANS.get(kind, ()):
+                                candidates = endpoint_by_adapter_func.get(key)
+                                if candidates and (take_first or len(candidates) == 1):
+                                    matching_endpoint = candidates[0]
+                                    break
+                        
+                        if matching_endpoint:
+                            step['id'] = matching_endpoint['id']
+                        else:
+                            activity_role = activity.get('role', 'N/A') if activity_idx is not None and activity_idx < len(jpk_activities) else 'N/A'
+                            step_warnings.append(f"      - Could not find matching endpoint for step ID {step_id[:8]}... (role: {activity_role})")
                 
-                for step_idx, step in enumerate(operation.get('steps', [])):
-                    step_id = step.get('id')
-                    step_type = step.get('type')
+                # For scripts (Type 400), map JPK activity_id to Type 400 script component ID
+                # Scripts now use content_id as component ID (for RunScript() compatibility)
+                # Operation steps use activity_id, so we need to map activity_id → content_id
+                elif step_type == 400 and step_id:
+                    # step_id is activity_id, need to map to content_id
+                    content_id = (activity_id_to_content_id or {}).get(step_id)
                     
-                    # For transformations (Type 700), map JPK content_id to new transformation ID
-                    if step_type == 700 and step_id:
-                        # step_id is the JPK content_id (original transformation ID from JPK)
-                        # Map it to the new JSON transformation ID
-                        mapped_id = jpk_id_to_json_id.get(step_id)
-                        if mapped_id:
-                            step['id'] = mapped_id
+                    if content_id:
+                        # Find script by content_id
+                        matching_script = script_by_id.get(content_id)
+                        if matching_script:
+                            # Update step ID to use content_id (script component ID)
+                            step['id'] = content_id
                         else:
-                            print(f"   ⚠️  Warning: Could not map transformation step ID {step_id[:8]}... to new transformation ID")
-                    
-                    # For endpoints (Type 500), match by adapter+function or direct ID
-                    elif step_type == 500 and step_id:
-                        # Try direct ID match first
-                        matching_endpoint = endpoint_by_id.get(step_id)
-                        
-                        if not matching_endpoint:
-                            # Try to match by adapter + function based on activity role
+                            step_warnings.append(f"      - Script with content_id {content_id[:8]}... not found (mapped from activity_id {step_id[:8]}...)")
+                    else:
+                        # Try direct match (in case step_id is already content_id)
+                        matching_script = script_by_id.get(step_id)
+                        if not matching_script:
                             activity_idx = step_to_activity_map.get(step_idx)
                             if activity_idx is not None and activity_idx < len(jpk_activities):
                                 activity = jpk_activities[activity_idx]
-                                role = activity.get('role', '').lower()
-                                activity_type = str(activity.get('type', ''))
-                                
-                                # NetSuite Function (type 232) -> netsuite + upsert
-                                if ('netsuite' in role and 'function' in role) or activity_type == '232':
-                                    candidates = endpoint_by_adapter_func.get(('netsuite', 'upsert'), [])
-                                    # Prefer endpoint without '_old' suffix
-                                    matching_endpoint = next((e for e in candidates if '_old' not in e.get('name', '')), None)
-                                    if not matching_endpoint and candidates:
-                                        matching_endpoint = candidates[0]
-                                
-                                # Source/Target activities - check multiple possibilities
-                                elif role in ['source', 'target']:
-                                    # Source activities can be:
-                                    # 1. Salesforce Query (for reading Salesforce data)
-                                    # 2. TempStorage read (for reading temp storage)
-                                    # 
-                                    # IMPORTANT: For NetSuite operations, prioritize TempStorage to avoid
-                                    # multiple SOAP activities (Jitterbit rule: only one SOAP activity per operation)
-                                    if role == 'source':
-                                        # Check if this is a NetSuite operation (has NetSuite Function activity)
-                                        # Role can be "NetSuite Function" (with capital letters and space)
-                                        is_netsuite_operation = any(
-                                            'netsuite' in a.get('role', '').lower() and 'function' in a.get('role', '').lower() or 
-                                            str(a.get('type', '')) == '232'
-                                            for a in jpk_activities
-                                        )
-                                        
-                                        if is_netsuite_operation:
-                                            # For NetSuite operations, prioritize TempStorage to avoid multiple SOAP activities
-                                            candidates = endpoint_by_adapter_func.get(('tempstorage', 'tempstorage_read'), [])
-                                            if candidates:
-                                                # If multiple candidates, prefer one with "Canonical" or "Contact" in name
-                                                # (matches the Source activity which reads canonical contact data)
-                                                if len(candidates) > 1:
-                                                    canonical_candidates = [e for e in candidates if 'canonical' in e.get('name', '').lower() or 'contact' in e.get('name', '').lower()]
-                                                    if canonical_candidates:
-                                                        matching_endpoint = canonical_candidates[0]
-                                                    else:
-                                                        matching_endpoint = candidates[0]
-                                                else:
-                                                    matching_endpoint = candidates[0]
-                                            
-                                            # Fallback to Salesforce Query if TempStorage not found
-                                            if not matching_endpoint:
-                                                candidates = endpoint_by_adapter_func.get(('salesforce', 'query'), [])
-                                                if candidates:
-                                                    matching_endpoint = candidates[0] if len(candidates) == 1 else None
-                                        else:
-                                            # For non-NetSuite operations, try Salesforce Query first (common pattern)
-                                            candidates = endpoint_by_adapter_func.get(('salesforce', 'query'), [])
-                                            if candidates:
-                                                matching_endpoint = candidates[0] if len(candidates) == 1 else None
-                                            
-                                            # Fallback to tempstorage if Salesforce not found
-                                            if not matching_endpoint:
-                                                candidates = endpoint_by_adapter_func.get(('tempstorage', 'tempstorage_read'), [])
-                                                if candidates:
-                                                    matching_endpoint = candidates[0] if len(candidates) == 1 else None
-                                    else:
-                                        # Target activities are typically tempstorage write
-                                        candidates = endpoint_by_adapter_func.get(('tempstorage', 'tempstorage_write'), [])
-                                        if candidates:
-                                            # If multiple candidates, try to match by name hint from operation context
-                                            # Otherwise use first candidate as fallback
-                                            if len(candidates) == 1:
-                                                matching_endpoint = candidates[0]
-                                            else:
-                                                # For now, use first candidate as fallback
-                                                # TODO: Improve matching logic to identify specific endpoint based on operation context
-                                                matching_endpoint = candidates[0]
-                                
-                                # Salesforce Query -> salesforce + query (explicit Salesforce role)
-                                # Also handle "Web Service Call" role which can be Salesforce Query
-                                elif 'salesforce' in role or activity_type == '14' or role.lower() == 'web service call':
-                                    candidates = endpoint_by_adapter_func.get(('salesforce', 'query'), [])
-                                    if candidates:
-                                        matching_endpoint = candidates[0] if len(candidates) == 1 else None
-                            
-                            if matching_endpoint:
-                                step['id'] = matching_endpoint['id']
-                            else:
-                                activity_role = activity.get('role', 'N/A') if activity_idx is not None and activity_idx < len(jpk_activities) else 'N/A'
-                                print(f"   ⚠️  Warning: Could not find matching endpoint for step ID {step_id[:8]}... (role: {activity_role})")
-                    
-                    # For scripts (Type 400), map JPK activity_id to Type 400 script component ID
-                    # Scripts now use content_id as component ID (for RunScript() compatibility)
-                    # Operation steps use activity_id, so we need to map activity_id → content_id
-                    elif step_type == 400 and step_id:
-                        # step_id is activity_id, need to map to content_id
-                        content_id = (activity_id_to_content_id or {}).get(step_id)
-                        
-                        if content_id:
-                            # Find script by content_id
-                            matching_script = script_by_id.get(content_id)
-                            if matching_script:
-                                # Update step ID to use content_id (script component ID)
-                                step['id'] = content_id
-                            else:
-                                print(f"   ⚠️  Warning: Script with content_id {content_id[:8]}... not found (mapped from activity_id {step_id[:8]}...)")
-                        else:
-                            # Try direct match (in case step_id is already content_id)
-                            matching_script = script_by_id.get(step_id)
-                            if not matching_script:
-                                activity_idx = step_to_activity_map.get(step_idx)
-                                if activity_idx is not None and activity_idx < len(jpk_activities):
-                                    activity = jpk_activities[activity_idx]
-                                    print(f"   ⚠️  Warning: Script step ID {step_id[:8]}... (activity_id) could not be mapped to content_id. Script may not have been extracted from JPK.")
-                            # If direct match works, step_id is already correct
-                            pass
-                    
-                    updated_steps.append(step)
-                
-                operation['steps'] = updated_steps
-                operations.append(operation)
-                
-            except Exception as e:
-                print(f"   ⚠️  Error converting operation {jpk_op.get('name', 'Unknown')}: {e}")
-                continue
-        
-        return operations
+                                step_warnings.append(f"      - Script step ID {step_id[:8]}... (activity_id) could not be mapped to content_id. Script may not have been extracted from JPK.")
+                        # If direct match works, step_id is already correct
+                        pass
+            
+            if step_warnings:
+                print(f"   ⚠️  Warning: {len(step_warnings)} step mapping warning(s) for operation {jpk_op.get('name', 'Unknown')}:")
+                print("\n".join(step_warnings))
+            
+            return operation
+            
+        except Exception as e:
+            print(f"   ⚠️  Error converting operation {jpk_op.get('name', 'Unknown')}: {e}")
+            return None
 
     def _save_result(self, result: Dict[str, Any], output_path: str) -> None:
         """
@@ -2117,8 +2153,8 @@ class JPKConverter:
             # Add converter version metadata
             result['_converter'] = get_version_info()
 
-            with open(output_path, 'w') as f:
-                json.dump(result, f, separators=(',', ':'))
+            # Compact output (orjson when installed, stdlib json otherwise)
+            write_json_compact(result, output_path)
 
             print(f"✅ Conversion complete!")
             print(f"   📁 Output: {output_path}")
@@ -2148,21 +2184,32 @@ class JPKConverter:
             schema_components: List of Type 900 schema components
         """
         # Build lookup map: schema_name -> Type 900 component ID (for user schemas)
+        # Also find the first flat schema (customSchemaIsFlat=True) with a name and ID, used for flat targets
         schema_name_to_id = {}
+        schema_by_id = {}  # First component per ID (for structure checks)
+        flat_schema = None  # (schema_id, schema_name)
         for schema_comp in schema_components:
             schema_name = schema_comp.get('name')
             schema_id = schema_comp.get('id')
+            schema_by_id.setdefault(schema_id, schema_comp)
             if schema_name and schema_id:
                 schema_name_to_id[schema_name] = schema_id
+                if flat_schema is None:
+                    if _is_flat_schema_document(schema_comp.get('schemaTypeDocument')):
+                        flat_schema = (schema_id, schema_name)
         
         # Build lookup map: (origin.id, direction) -> Type 900 component ID (for connector schemas)
         # Also build: schema_name -> Type 900 component ID (for exact name matching)
+        # Also index all schemas by (origin.id, direction) for candidate selection
         origin_to_id = {}
         schema_name_to_id_connector = {}  # For connector schemas by name
+        origin_key_to_schemas = defaultdict(list)
         for schema_comp in schema_components:
             origin = schema_comp.get('origin')
             schema_name = schema_comp.get('name')
             schema_id = schema_comp.get('id')
+            if origin:
+                origin_key_to_schemas[(origin.get('id'), origin.get('direction'))].append((schema_id, schema_comp))
             if origin and schema_id:
                 origin_id = origin.get('id')
                 direction = origin.get('direction')
@@ -2176,165 +2223,170 @@ class JPKConverter:
                     if schema_name:
                         schema_name_to_id_connector[schema_name] = schema_id
         
+        # Memoized structure checks (transformations often share candidates and srcPaths)
+        structure_cache = {}
+        schema_paths_cache = {}  # schema_id -> flattened path set, built once per candidate schema
+        
+        def has_required_structure(candidate_id: str, src_paths: List[str]) -> bool:
+            cache_key = (candidate_id, frozenset(src_paths))
+            result = structure_cache.get(cache_key)
+            if result is None:
+                result = self._schema_has_required_structure(schema_by_id, candidate_id, src_paths, schema_paths_cache)
+                structure_cache[cache_key] = result
+            return result
+        
+        # Local aliases for the lookups made once per connector-source transformation
+        get_connector_schema_id = schema_name_to_id_connector.get
+        get_origin_candidates = origin_key_to_schemas.get
+        
         # Update transformations to include source.id for connector schemas and target.id for user schemas
         updated_count = 0
         for transform in transformations:
             # CRITICAL FIX: Add source.id for connector schemas (matching Type 900 component ID)
             # This fixes component-level validation errors (investigation_summary_2025-12-11.md)
-            # Use rule-based Response transformation detection
-            transform_name = transform.get('name', '')
-            mapping_rules = transform.get('mappingRules', [])
-            is_response_with_script = should_remove_source_origin(transform_name, mapping_rules)
-            
+            # Only connector sources (with origin) need this; user-schema transformations skip straight to the target
             source = transform.get('source')
-            if source:
-                source_origin = source.get('origin')
-                if source_origin:
-                    # CRITICAL FIX (December 15, 2025): Keep origin.id for connector schemas
-                    # The validation expects source.origin.id === activity.id (main-EBGGZ3NW.js:115745)
-                    # Baseline Response transformation has origin.id pointing to activity ID, not a Type 900 schema ID
-                    # Removing origin causes "source schema does not match" validation error
-                    # For ALL connector schemas (including Response transformations), keep origin.id pointing to activity
-                    if False:  # Disabled: was removing origin for Response transformations, but baseline shows origin is required
-                        # Find the Type 900 schema by name
-                        source_name = source.get('name')
-                        if source_name:
-                            source_schema = next((s for s in schema_components if s.get('name') == source_name), None)
-                            if source_schema:
-                                source['id'] = source_schema.get('id')
-                                # Remove origin for Response transformations (working reference pattern)
-                                del source['origin']
-                                updated_count += 1
-                                if self.trace_logger:
-                                    self.trace_logger.log_decision(
-                                        f"Updated Response transformation source: {transform_name}",
-                                        {"source_name": source_name, "source_id": source_schema.get('id'),
-                                         "reason": "Working reference pattern: source.id set, origin removed (investigation_summary_2025-12-13.md)"},
-                                        VerbosityLevel.DETAILED
-                                    )
-                    else:
-                        # Connector schema - find matching Type 900 component
-                        # CRITICAL FIX (December 14, 2025): When multiple schemas share same origin,
-                        # prefer the one with complete nested structure needed by transformation's srcPaths
-                        # This fixes issue: "NetSuite Upsert Contact - Response" transformation source
-                        # pointing to connector function output instead of Type 900 schema with writeResponse elements
-                        source_name = source.get('name')
-                        origin_id = source_origin.get('id')
-                        direction = source_origin.get('direction')
-                        
-                        schema_id = None
-                        match_method = None
-                        
-                        # Get transformation's srcPaths to determine required structure
-                        src_paths = []
-                        for mr in transform.get('mappingRules', []):
-                            mr_src_paths = mr.get('srcPaths', [])
-                            if mr_src_paths:
-                                src_paths.extend(mr_src_paths)
-                        
-                        # Priority 1: Match by exact name (most reliable when multiple schemas share origin_id+direction)
-                        if source_name and source_name in schema_name_to_id_connector:
-                            candidate_id = schema_name_to_id_connector[source_name]
-                            # Verify this schema has the required structure if srcPaths are specified
-                            if src_paths and self._schema_has_required_structure(schema_components, candidate_id, src_paths):
-                                schema_id = candidate_id
-                                match_method = "name_with_structure"
-                            elif not src_paths:
-                                # No srcPaths to check, use name match
-                                schema_id = candidate_id
-                                match_method = "name"
+            source_origin = source.get('origin') if source else None
+            if source_origin:
+                # Use rule-based Response transformation detection
+                transform_name = transform.get('name', '')
+                mapping_rules = transform.get('mappingRules', [])
+                is_response_with_script = should_remove_source_origin(transform_name, mapping_rules)
+                
+                # CRITICAL FIX (December 15, 2025): Keep origin.id for connector schemas
+                # The validation expects source.origin.id === activity.id (main-EBGGZ3NW.js:115745)
+                # Baseline Response transformation has origin.id pointing to activity ID, not a Type 900 schema ID
+                # Removing origin causes "source schema does not match" validation error
+                # For ALL connector schemas (including Response transformations), keep origin.id pointing to activity
+                if False:  # Disabled: was removing origin for Response transformations, but baseline shows origin is required
+                    # Find the Type 900 schema by name
+                    source_name = source.get('name')
+                    if source_name:
+                        source_schema = next((s for s in schema_components if s.get('name') == source_name), None)
+                        if source_schema:
+                            source['id'] = source_schema.get('id')
+                            # Remove origin for Response transformations (working reference pattern)
+                            del source['origin']
+                            updated_count += 1
+                            if self.trace_logger and self.trace_logger.accepts(VerbosityLevel.DETAILED):
+                                self.trace_logger.log_decision(
+                                    f"Updated Response transformation source: {transform_name}",
+                                    {"source_name": source_name, "source_id": source_schema.get('id'),
+                                     "reason": "Working reference pattern: source.id set, origin removed (investigation_summary_2025-12-13.md)"},
+                                    VerbosityLevel.DETAILED
+                                )
+                else:
+                    # Connector schema - find matching Type 900 component
+                    # CRITICAL FIX (December 14, 2025): When multiple schemas share same origin,
+                    # prefer the one with complete nested structure needed by transformation's srcPaths
+                    # This fixes issue: "NetSuite Upsert Contact - Response" transformation source
+                    # pointing to connector function output instead of Type 900 schema with writeResponse elements
+                    source_name = source.get('name')
+                    origin_id = source_origin.get('id')
+                    direction = source_origin.get('direction')
+                    
+                    schema_id = None
+                    match_method = None
+                    
+                    # Get transformation's unique srcPaths (in first-seen order) to determine required structure
+                    src_paths = list(dict.fromkeys(chain.from_iterable(
+                        mr.get('srcPaths') or () for mr in mapping_rules
+                    )))
+                    
+                    # Priority 1: Match by exact name (most reliable when multiple schemas share origin_id+direction)
+                    candidate_id = get_connector_schema_id(source_name) if source_name else None
+                    if candidate_id:
+                        # Verify this schema has the required structure if srcPaths are specified
+                        if src_paths and has_required_structure(candidate_id, src_paths):
+                            schema_id = candidate_id
+                            match_method = "name_with_structure"
+                        elif not src_paths:
+                            # No srcPaths to check, use name match
+                            schema_id = candidate_id
+                            match_method = "name"
+                    
+                    # Priority 2: If no name match or structure mismatch, find best match by origin.id + direction
+                    if not schema_id and origin_id and direction:
+                        key = (origin_id, direction)
+                        # Find all schemas with this origin
+                        candidate_schemas = get_origin_candidates(key, [])
                         
-                        # Priority 2: If no name match or structure mismatch, find best match by origin.id + direction
-                        if not schema_id and origin_id and direction:
-                            key = (origin_id, direction)
-                            # Find all schemas with this origin
-                            candidate_schemas = [
-                                (sc.get('id'), sc) for sc in schema_components
-                                if sc.get('origin', {}).get('id') == origin_id and 
-                                   sc.get('origin', {}).get('direction') == direction
-                            ]
+                        if candidate_schemas:
+                            if src_paths:
+                                # Prefer schema with complete structure
+                                for cand_id, cand_schema in candidate_schemas:
+                                    if has_required_structure(cand_id, src_paths):
+                                        schema_id = cand_id
+                                        match_method = "origin_id+direction_with_structure"
+                                        break
                             
-                            if candidate_schemas:
-                                if src_paths:
-                                    # Prefer schema with complete structure
-                                    for cand_id, cand_schema in candidate_schemas:
-                                        if self._schema_has_required_structure(schema_components, cand_id, src_paths):
-                                            schema_id = cand_id
-                                            match_method = "origin_id+direction_with_structure"
-                                            break
-                                
-                                # Fallback to first match if no structure match found
-                                if not schema_id:
-                                    schema_id = candidate_schemas[0][0]
-                                    match_method = "origin_id+direction"
-                        
-                        if schema_id:
-                            if not source.get('id') or source.get('id') != schema_id:
-                                source['id'] = schema_id
-                                updated_count += 1
-                                if self.trace_logger:
-                                    self.trace_logger.log_decision(
-                                        f"Added source.id to connector schema: {transform_name}",
-                                        {"source_name": source_name, "source_id": schema_id, 
-                                         "match_method": match_method,
-                                         "origin_id": origin_id, "direction": direction,
-                                         "src_paths_count": len(src_paths),
-                                         "reason": "Fixes component-level validation and source schema selection (investigation_summary_2025-12-13.md)"},
-                                        VerbosityLevel.DETAILED
-                                    )
+                            # Fallback to first match if no structure match found
+                            if not schema_id:
+                                schema_id = candidate_schemas[0][0]
+                                match_method = "origin_id+direction"
+                    
+                    if schema_id:
+                        if not source.get('id') or source.get('id') != schema_id:
+                            source['id'] = schema_id
+                            updated_count += 1
+                            if self.trace_logger and self.trace_logger.accepts(VerbosityLevel.DETAILED):
+                                self.trace_logger.log_decision(
+                                    f"Added source.id to connector schema: {transform_name}",
+                                    {"source_name": source_name, "source_id": schema_id, 
+                                     "match_method": match_method,
+                                     "origin_id": origin_id, "direction": direction,
+                                     "src_paths_count": len(src_paths),
+                                     "reason": "Fixes component-level validation and source schema selection (investigation_summary_2025-12-13.md)"},
+                                    VerbosityLevel.DETAILED
+                                )
             
             # Update target.id and target.name for user schemas (without origin)
             target = transform.get('target')
             if target:
                 # Only add target.id if it's a user schema (has document, no origin)
-                has_document = bool(target.get('document'))
+                target_doc = target.get('document')
+                has_document = bool(target_doc)
                 has_origin = bool(target.get('origin'))
                 
                 if has_document and not has_origin:
                     target_name = target.get('name')
                     # CRITICAL FIX: For flat schemas, check if there's a Type 900 schema with matching structure
                     # and update both name and ID to match (fixes "Target Schema" vs "New Flat Schema" mismatch)
-                    target_doc = target.get('document', {})
-                    is_flat = target_doc.get('O', {}).get('customSchemaIsFlat', False) if isinstance(target_doc, dict) else False
+                    is_flat = _is_flat_schema_document(target_doc)
                     
                     if is_flat:
-                        # Find flat schema by structure match (customSchemaIsFlat=True)
-                        for schema_comp in schema_components:
-                            schema_doc = schema_comp.get('schemaTypeDocument', {})
-                            schema_is_flat = schema_doc.get('O', {}).get('customSchemaIsFlat', False) if isinstance(schema_doc, dict) else False
-                            if schema_is_flat:
-                                # Found matching flat schema - update target name and ID
-                                schema_name = schema_comp.get('name')
-                                schema_id = schema_comp.get('id')
-                                if schema_name and schema_id:
-                                    # Update target name to match Type 900 schema name
-                                    if target.get('name') != schema_name:
-                                        target['name'] = schema_name
-                                        updated_count += 1
-                                    # Update target ID
-                                    if not target.get('id') or target.get('id') != schema_id:
-                                        target['id'] = schema_id
-                                        updated_count += 1
-                                    # CRITICAL: Update target.document.name to match schema name
-                                    # This is required for validation (reference pattern)
-                                    target_doc = target.get('document', {})
-                                    if isinstance(target_doc, dict) and target_doc.get('name') != schema_name:
-                                        target_doc['name'] = schema_name
-                                        updated_count += 1
-                                    if self.trace_logger:
-                                        self.trace_logger.log_decision(
-                                            f"Updated flat schema target name/ID/document.name: {transform.get('name')}",
-                                            {"old_name": target_name, "new_name": schema_name, "target_id": schema_id},
-                                            VerbosityLevel.DETAILED
-                                        )
-                                    break
+                        if flat_schema:
+                            # Use the first flat Type 900 schema (customSchemaIsFlat=True) - update target name and ID
+                            schema_id, schema_name = flat_schema
+                            # Update target name to match Type 900 schema name
+                            if target_name != schema_name:
+                                target['name'] = schema_name
+                                updated_count += 1
+                            # Update target ID
+                            if not target.get('id') or target.get('id') != schema_id:
+                                target['id'] = schema_id
+                                updated_count += 1
+                            # CRITICAL: Update target.document.name to match schema name
+                            # This is required for validation (reference pattern)
+                            # Rename on a copy: the embedded document may be the shared instance
+                            # cached by the transformation converter (_ref_doc_cache)
+                            if target_doc.get('name') != schema_name:
+                                target_doc = dict(target_doc, name=schema_name)
+                                target['document'] = target_doc
+                                updated_count += 1
+                            if self.trace_logger and self.trace_logger.accepts(VerbosityLevel.DETAILED):
+                                self.trace_logger.log_decision(
+                                    f"Updated flat schema target name/ID/document.name: {transform.get('name')}",
+                                    {"old_name": target_name, "new_name": schema_name, "target_id": schema_id},
+                                    VerbosityLevel.DETAILED
+                                )
                     elif target_name and target_name in schema_name_to_id:
                         # Non-flat user schema - match by name
                         target_id = schema_name_to_id[target_name]
                         if not target.get('id') or target.get('id') != target_id:
                             target['id'] = target_id
                             updated_count += 1
-                            if self.trace_logger:
+                            if self.trace_logger and self.trace_logger.accepts(VerbosityLevel.DETAILED):
                                 self.trace_logger.log_decision(
                                     f"Added target.id to user schema: {transform.get('name')}",
                                     {"target_name": target_name, "target_id": target_id},
@@ -2347,7 +2399,7 @@ class JPKConverter:
     def _remove_source_from_first_step_transformations(
         self, 
         transformations: List[Dict[str, Any]], 
-        operations: List[Dict[str, Any]]
+        operation_index: OperationIndex
     ) -> None:
         """
         Remove source schema from transformations that are the first step in operations.
@@ -2360,26 +2412,14 @@ class JPKConverter:
         
         Args:
             transformations: List of Type 700 transformation components
-            operations: List of Type 200 operation components
+            operation_index: Step-order index of the converted Type 200 operations
         """
         updated_count = 0
         
-        # Build map: transformation_id -> is_first_step
+        # First-step transformation IDs
         # Also check by original_jpk_id in case step IDs haven't been mapped yet
-        transform_id_to_is_first = {}
-        transform_jpk_id_to_is_first = {}
-        
-        for operation in operations:
-            steps = operation.get('steps', [])
-            if steps:
-                first_step = steps[0]
-                first_step_id = first_step.get('id')
-                first_step_type = first_step.get('type')
-                # Only mark transformations (type 700) as first step
-                if first_step_type == 700 and first_step_id:
-                    transform_id_to_is_first[first_step_id] = True
-                    # Also check if this might be a JPK content_id that needs mapping
-                    transform_jpk_id_to_is_first[first_step_id] = True
+        first_step_ids = operation_index.first_step_transform_ids
+        removed_lines = []
         
         # Remove source schema from transformations that are first step
         for transform in transformations:
@@ -2388,8 +2428,8 @@ class JPKConverter:
             original_jpk_id = metadata.get('original_jpk_id')
             
             # Check both current ID and original JPK ID
-            is_first_step = (transform_id in transform_id_to_is_first or 
-                           (original_jpk_id and original_jpk_id in transform_jpk_id_to_is_first))
+            is_first_step = (transform_id in first_step_ids or 
+                           (original_jpk_id and original_jpk_id in first_step_ids))
             
             if is_first_step:
                 source = transform.get('source')
@@ -2400,7 +2440,7 @@ class JPKConverter:
                         del transform['source']
                         updated_count += 1
                         transform_name = transform.get('name', 'Unknown')
-                        print(f"   🔧 Removed source schema from first-step transformation: {transform_name}")
+                        removed_lines.append(f"   🔧 Removed source schema from first-step transformation: {transform_name}")
                         if self.trace_logger:
                             self.trace_logger.log_decision(
                                 f"Removed source schema from first-step transformation: {transform_name}",
@@ -2410,12 +2450,14 @@ class JPKConverter:
                             )
         
         if updated_count > 0:
-            print(f"   📊 Removed source schema from {updated_count} first-step transformation(s)")
+            # Per-transformation lines are printed together with the summary (one write)
+            removed_lines.append(f"   📊 Removed source schema from {updated_count} first-step transformation(s)")
+            print("\n".join(removed_lines))
     
     def _update_transformation_origin_ids(
         self,
         transformations: List[Dict[str, Any]],
-        operations: List[Dict[str, Any]]
+        operation_index: OperationIndex
     ) -> None:
         """
         Update source.origin.id in transformations to point to correct activity IDs based on operation step order.
@@ -2427,19 +2469,12 @@ class JPKConverter:
 
         Args:
             transformations: List of Type 700 transformation components
-            operations: List of Type 200 operation components
+            operation_index: Step-order index of the converted Type 200 operations
         """
-        # Build map: transformation_id -> (operation, step_index)
-        transform_to_operation = {}
-        for operation in operations:
-            steps = operation.get('steps', [])
-            for step_idx, step in enumerate(steps):
-                if step.get('type') == 700:  # Transformation step
-                    transform_id = step.get('id')
-                    if transform_id:
-                        transform_to_operation[transform_id] = (operation, step_idx)
+        activity_before_transform = operation_index.activity_before_transform
         
         updated_count = 0
+        updated_lines = []
         for transform in transformations:
             transform_id = transform.get('id')
             source = transform.get('source')
@@ -2457,37 +2492,25 @@ class JPKConverter:
             # We identify these by checking if the function is NOT 'query' (e.g., 'update', 'insert')
             function_name = origin.get('functionName', '')
             adapter_id = origin.get('adapterId', '')
-            if adapter_id == 'salesforce' and function_name in ['update', 'insert', 'delete', 'upsert']:
+            if adapter_id == 'salesforce' and function_name in _SALESFORCE_NON_QUERY_FUNCTIONS:
                 # This is a Salesforce non-query Response transformation
                 # The origin.id is already correctly set to the WebServiceCall ID
                 # Skip updating it to avoid pointing to the wrong activity
                 continue
 
-            # Find which operation contains this transformation and its step index
-            if transform_id not in transform_to_operation:
+            # Find which operation contains this transformation and the activity step that appears before it
+            # The origin.id should point to this activity
+            if transform_id not in activity_before_transform:
                 continue
 
-            operation, transform_step_idx = transform_to_operation[transform_id]
-            steps = operation.get('steps', [])
-
-            # Find the activity step that appears before this transformation
-            # The origin.id should point to this activity
-            source_activity_id = None
-            for step_idx in range(transform_step_idx - 1, -1, -1):  # Look backwards from transformation step
-                if step_idx < len(steps):
-                    step = steps[step_idx]
-                    step_type = step.get('type')
-                    # Look for Type 500 (endpoint/activity) or Type 400 (script) steps
-                    if step_type in [400, 500]:
-                        source_activity_id = step.get('id')
-                        break
+            operation, source_activity_id = activity_before_transform[transform_id]
 
             if source_activity_id and origin.get('id') != source_activity_id:
                 old_origin_id = origin.get('id', '')
                 origin['id'] = source_activity_id
                 updated_count += 1
                 transform_name = transform.get('name', 'Unknown')
-                print(f"   🔧 Updated origin.id for transformation: {transform_name} ({old_origin_id[:8]}... → {source_activity_id[:8]}...)")
+                updated_lines.append(f"   🔧 Updated origin.id for transformation: {transform_name} ({old_origin_id[:8]}... → {source_activity_id[:8]}...)")
                 if self.trace_logger:
                     self.trace_logger.log_decision(
                         f"Updated origin.id for transformation: {transform_name}",
@@ -2500,9 +2523,12 @@ class JPKConverter:
                     )
         
         if updated_count > 0:
-            print(f"   📊 Updated origin.id for {updated_count} transformation(s)")
+            # Per-transformation lines are printed together with the summary (one write)
+            updated_lines.append(f"   📊 Updated origin.id for {updated_count} transformation(s)")
+            print("\n".join(updated_lines))
     
-    def _schema_has_required_structure(self, schema_components: List[Dict[str, Any]], schema_id: str, src_paths: List[str]) -> bool:
+    def _schema_has_required_structure(self, schema_by_id: Dict[str, Dict[str, Any]], schema_id: str, src_paths: List[str],
+                                       schema_paths_cache: Optional[Dict[str, set]] = None) -> bool:
         """
         Check if a Type 900 schema has the required nested structure for transformation srcPaths.
         
@@ -2511,10 +2537,12 @@ class JPKConverter:
         not just connector function outputs without the nested structure.
         
         Args:
-            schema_components: List of all Type 900 schema components
+            schema_by_id: Type 900 schema components by ID
             schema_id: ID of the schema to check
             src_paths: List of source paths required by the transformation (e.g., 
                       ["jbroot/jbresponse/upsertListResponse/writeResponseList/writeResponse/status/isSuccess"])
+            schema_paths_cache: Optional schema_id -> flattened path set cache (see _index_schema_paths),
+                      so each schema tree is walked once however many transformations check it
         
         Returns:
             True if schema contains all required paths, False otherwise
@@ -2522,40 +2550,69 @@ class JPKConverter:
         if not src_paths:
             return True  # No requirements, any schema works
         
-        # Find the schema component
-        schema_comp = next((sc for sc in schema_components if sc.get('id') == schema_id), None)
-        if not schema_comp:
+        schema_paths = schema_paths_cache.get(schema_id) if schema_paths_cache is not None else None
+        if schema_paths is None:
+            # Find the schema component and flatten its document root
+            schema_comp = schema_by_id.get(schema_id)
+            root = (schema_comp.get('schemaTypeDocument', {}).get('root', {}) if schema_comp else None)
+            schema_paths = self._index_schema_paths(root) if root else set()
+            if schema_paths_cache is not None:
+                schema_paths_cache[schema_id] = schema_paths
+        if not schema_paths:
             return False
         
-        # Get the schema document root
-        schema_doc = schema_comp.get('schemaTypeDocument', {})
-        root = schema_doc.get('root', {})
-        if not root:
-            return False
-        
-        # Check each required path
+        # Check each required path (set lookup instead of a per-segment child scan)
         for src_path in src_paths:
-            if not self._path_exists_in_schema(root, src_path):
+            if not src_path or self._clean_schema_path_segments(src_path) not in schema_paths:
                 return False
         
         return True
     
-    def _path_exists_in_schema(self, root: Dict[str, Any], path: str) -> bool:
+    @staticmethod
+    def _index_schema_paths(root: Dict[str, Any]) -> set:
         """
-        Check if a path exists in a schema document structure.
+        Flatten a schema document tree into the set of segment tuples reachable from the root.
         
-        Handles jbroot/jbresponse prefixes and array element notation (e.g., "1" in baseRef/1/RecordRef).
+        Among siblings with the same name only the first one is descended into, so a path resolves
+        the way a first-match walk from the root would. The root itself is the empty tuple.
         
         Args:
             root: Schema document root node
-            path: Path to check (e.g., "jbroot/jbresponse/upsertListResponse/writeResponseList/writeResponse/status/isSuccess")
         
         Returns:
-            True if path exists, False otherwise
+            Set of name tuples, e.g. {(), ('upsertListResponse',), ('upsertListResponse', 'writeResponseList'), ...}
         """
-        if not path or not root:
-            return False
+        paths = {()}
+        stack = [((), root)]
+        while stack:
+            prefix, node = stack.pop()
+            seen_names = set()
+            for child in node.get('C') or ():
+                name = child.get('N')
+                if name in seen_names:
+                    continue
+                seen_names.add(name)
+                child_path = prefix + (name,)
+                paths.add(child_path)
+                stack.append((child_path, child))
+        return paths
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _clean_schema_path_segments(path: str) -> Tuple[str, ...]:
+        """
+        Normalize a transformation srcPath into schema segments.
         
+        Removes jbroot/jbresponse prefixes (schema starts from e.g. upsertListResponse), array indices and
+        redundant RecordRef after baseRef (e.g. baseRef/1/RecordRef), and $ suffixes.
+        Memoized: the same srcPaths are checked against every candidate schema of every transformation.
+        
+        Args:
+            path: Path to normalize (e.g., "jbroot/jbresponse/upsertListResponse/writeResponseList")
+        
+        Returns:
+            Tuple of segment names
+        """
         # Split path into segments
         segments = path.split('/')
         
@@ -2568,7 +2625,7 @@ class JPKConverter:
         # Remove numeric array indices (e.g., "1" in baseRef/1/RecordRef) for schema matching
         # Also remove "RecordRef" if it's redundant (e.g., baseRef/RecordRef)
         cleaned_segments = []
-        for i, seg in enumerate(segments):
+        for seg in segments:
             # Skip numeric segments that are array indices
             if seg.isdigit() and cleaned_segments and cleaned_segments[-1] in ['baseRef']:
                 continue
@@ -2579,21 +2636,7 @@ class JPKConverter:
             seg = seg.rstrip('$')
             cleaned_segments.append(seg)
         
-        # Traverse the schema structure
-        current_node = root
-        for seg in cleaned_segments:
-            found = False
-            # Check children
-            if 'C' in current_node:
-                for child in current_node['C']:
-                    if child.get('N') == seg:
-                        current_node = child
-                        found = True
-                        break
-            if not found:
-                return False
-        
-        return True
+        return tuple(cleaned_segments)
     
     def _validate_transformation_schema_references(self, transformations: List[Dict[str, Any]], schema_components: List[Dict[str, Any]]) -> None:
         """
@@ -2617,70 +2660,41 @@ class JPKConverter:
             if schema_id:
                 schema_id_set.add(schema_id)
         
-        missing_schemas = []
+        # Named source/target references: (transformation, role, schema_name, schema_id)
+        refs = [
+            (transform.get('name', 'Unknown'), role, ref.get('name'), ref.get('id'))
+            for transform in transformations
+            for role, ref in (('source', transform.get('source')), ('target', transform.get('target')))
+            if ref and ref.get('name')
+        ]
         
-        for transform in transformations:
-            trans_name = transform.get('name', 'Unknown')
-            
-            # Check source schema
-            source = transform.get('source', {})
-            source_name = source.get('name')
-            source_id = source.get('id')
-            
-            if source_name:
-                # Check if schema exists by name
-                if source_name not in schema_name_to_id:
-                    missing_schemas.append({
-                        'transformation': trans_name,
-                        'role': 'source',
-                        'schema_name': source_name,
-                        'schema_id': source_id,
-                        'issue': 'Schema name not found in Type 900 components'
-                    })
-                # If source has an ID, verify it exists
-                elif source_id and source_id not in schema_id_set:
-                    missing_schemas.append({
-                        'transformation': trans_name,
-                        'role': 'source',
-                        'schema_name': source_name,
-                        'schema_id': source_id,
-                        'issue': 'Source ID does not match any Type 900 component ID'
-                    })
-            
-            # Check target schema
-            target = transform.get('target', {})
-            target_name = target.get('name')
-            target_id = target.get('id')
-            
-            if target_name:
+        # Set differences find unresolved names/IDs; refs are only walked again when something is missing
+        missing_names = {ref[2] for ref in refs}.difference(schema_name_to_id)
+        missing_ids = {ref[3] for ref in refs if ref[3]}.difference(schema_id_set)
+        
+        # (transformation, role, schema_name, schema_id, issue) tuples; expanded to dicts only for the trace log
+        missing_schemas = []
+        if missing_names or missing_ids:
+            for trans_name, role, schema_name, schema_id in refs:
                 # Check if schema exists by name
-                if target_name not in schema_name_to_id:
-                    missing_schemas.append({
-                        'transformation': trans_name,
-                        'role': 'target',
-                        'schema_name': target_name,
-                        'schema_id': target_id,
-                        'issue': 'Schema name not found in Type 900 components'
-                    })
-                # If target has an ID, verify it exists
-                elif target_id and target_id not in schema_id_set:
-                    missing_schemas.append({
-                        'transformation': trans_name,
-                        'role': 'target',
-                        'schema_name': target_name,
-                        'schema_id': target_id,
-                        'issue': 'Target ID does not match any Type 900 component ID'
-                    })
+                if schema_name in missing_names:
+                    missing_schemas.append((trans_name, role, schema_name, schema_id, 'Schema name not found in Type 900 components'))
+                # If the reference has an ID, verify it exists
+                elif schema_id in missing_ids:
+                    missing_schemas.append((trans_name, role, schema_name, schema_id,
+                                            f"{role.capitalize()} ID does not match any Type 900 component ID"))
         
         # Report missing schemas
         if missing_schemas:
             print(f"   ⚠️  WARNING: Found {len(missing_schemas)} transformation schema reference(s) that cannot be resolved:")
-            for missing in missing_schemas:
-                print(f"      - {missing['transformation']}: {missing['role']} schema '{missing['schema_name']}' - {missing['issue']}")
-            if self.trace_logger:
+            for trans_name, role, schema_name, _, issue in missing_schemas:
+                print(f"      - {trans_name}: {role} schema '{schema_name}' - {issue}")
+            if self.trace_logger and self.trace_logger.accepts(VerbosityLevel.DETAILED):
+                missing_fields = ('transformation', 'role', 'schema_name', 'schema_id', 'issue')
                 self.trace_logger.log_decision(
                     "Transformation schema validation found missing references",
-                    {"missing_count": len(missing_schemas), "missing_schemas": missing_schemas},
+                    {"missing_count": len(missing_schemas),
+                     "missing_schemas": [dict(zip(missing_fields, missing)) for missing in missing_schemas]},
                     VerbosityLevel.DETAILED
                 )
         else:
@@ -5,7 +5,9 @@ This module provides factory methods for creating Type 500 and Type 600
 endpoint components with proper templates and configuration.
 """
 
-import uuid
+import copy
+import sys
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 
 from .template_manager import TemplateManager
@@ -18,6 +20,125 @@ from ..config.endpoint_rules import (
 )
 
 
+# Constant component fields, bound once so factory methods don't repeat the dict lookups
+_CHECKSUM = DEFAULT_PROPERTIES['CHECKSUM']
+_METADATA_VERSION = DEFAULT_PROPERTIES['METADATA_VERSION']
+_VALIDATION_STATE = DEFAULT_PROPERTIES['VALIDATION_STATE']
+_ENDPOINT_TYPE = COMPONENT_TYPES['ENDPOINT']
+_CONNECTION_TYPE = COMPONENT_TYPES['CONNECTION']
+
+# Default endpoint properties, built once at import. All values are scalars, so
+# copying each property dict gives callers a fully independent list.
+_DEFAULT_PROPERTIES_TEMPLATE = tuple(
+    {
+        "type": "string",
+        "multiple": False,
+        "name": property_name,
+        "hidden": True,
+        "defaultValue": DEFAULT_PROPERTIES[default_key]
+    }
+    for property_name, default_key in (
+        ("entityId", 'ENTITY_ID'),
+        ("source_type_id", 'SOURCE_TYPE_ID'),
+        ("target_type_id", 'TARGET_TYPE_ID'),
+        ("file_share_id", 'FILE_SHARE_ID'),
+    )
+)
+
+# Type 500 component templates with the constant fields filled in (key order is the output order).
+# Per-call fields are None placeholders; mutable values (lists/dicts) are created fresh for each component.
+_TEMPSTORAGE_TYPE_500_TEMPLATE = {
+    "name": None,
+    "kind": None,
+    "discoveryType": "FileBasedDiscovery",
+    "polarity": None,
+    "inputRequired": False,
+    "properties": None,
+    "pageStatus": None,
+    "partial": False,
+    "functionName": None,
+    "type": _ENDPOINT_TYPE,
+    "adapterId": "tempstorage",
+    "endpoint": None,
+    "id": None,
+    "checksum": _CHECKSUM,
+    "metadataVersion": _METADATA_VERSION,
+    "encryptedAtRest": True,
+    "passwordEncAtAppLevel": True,
+    "validationState": _VALIDATION_STATE,
+    "hidden": False,
+    "isSchemaDiscovered": True,
+    "isConfigurationComplete": True,
+    "requiresDeploy": True,
+    "plugins": None,
+    "chunks": 1
+}
+
+_TYPE_500_TEMPLATE = {
+    "name": None,
+    "kind": None,
+    "discoveryType": "FileBasedDiscovery",
+    "polarity": None,
+    "properties": None,
+    "pageStatus": None,
+    "functionName": None,
+    "type": _ENDPOINT_TYPE,
+    "adapterId": None,
+    "endpoint": None,
+    "id": None,
+    "checksum": _CHECKSUM,
+    "metadataVersion": _METADATA_VERSION,
+    "encryptedAtRest": True,
+    "passwordEncAtAppLevel": True,
+    "validationState": _VALIDATION_STATE,
+    "hidden": False,
+    "isSchemaDiscovered": True,
+    "isConfigurationComplete": True,
+    "requiresDeploy": True,
+    "plugins": None,
+    "chunks": 1,
+    "partial": False
+}
+
+# Fallback Type 600 (tempstorage, or business adapter without a template); same conventions as above
+_FALLBACK_TYPE_600_TEMPLATE = {
+    "name": None,
+    "isFileBased": True,
+    "properties": None,
+    "type": _CONNECTION_TYPE,
+    "adapterId": None,
+    "id": None,
+    "checksum": _CHECKSUM,
+    "metadataVersion": _METADATA_VERSION,
+    "encryptedAtRest": True,
+    "passwordEncAtAppLevel": True,
+    "validationState": _VALIDATION_STATE,
+    "hidden": False,
+    "requiresDeploy": True
+}
+
+# Fixed fields merged over business-adapter Type 600 templates (after 'id')
+_BUSINESS_TYPE_600_FIELDS = {
+    'checksum': _CHECKSUM,
+    'metadataVersion': _METADATA_VERSION,
+    'encryptedAtRest': True,
+    'passwordEncAtAppLevel': True,
+    'validationState': _VALIDATION_STATE,
+    'hidden': False,
+    'requiresDeploy': True
+}
+
+@lru_cache(maxsize=None)
+def _cached_endpoint_metadata(adapter_id: str, endpoint_type: int) -> Dict[str, Any]:
+    """Endpoint metadata for (adapter_id, endpoint_type); shared, so callers must copy it."""
+    return create_endpoint_metadata(adapter_id, endpoint_type)
+
+
+# Fields validate_endpoint requires on every endpoint, and additionally on Type 500
+_REQUIRED_ENDPOINT_FIELDS = frozenset({'id', 'type', 'name'})
+_REQUIRED_TYPE_500_FIELDS = _REQUIRED_ENDPOINT_FIELDS | {'polarity', 'functionName'}
+
+
 class EndpointFactory:
     """
     Factory class for creating endpoint components.
@@ -27,6 +148,8 @@ class EndpointFactory:
     when templates are missing.
     """
 
+    __slots__ = ("template_manager", "_type_600_templates")
+
     def __init__(self, template_manager: TemplateManager = None):
         """
         Initialize endpoint factory.
@@ -36,6 +159,8 @@ class EndpointFactory:
                             If None, creates a new instance.
         """
         self.template_manager = template_manager or TemplateManager()
+        # (adapter_id, templates_dir) -> template as loaded (never handed out; callers get deep copies)
+        self._type_600_templates: Dict[tuple, Optional[Dict[str, Any]]] = {}
 
     def create_type_600(self, endpoint_id: str, adapter_id: str,
                        templates_dir: str = None) -> Dict[str, Any]:
@@ -51,51 +176,53 @@ class EndpointFactory:
             templates_dir: Directory containing template files (optional)
 
         Returns:
-            Dictionary representing Type 600 endpoint component
+            Dictionary representing Type 600 endpoint component. Always a new object that shares
+            no nested values with the cached template or other endpoints, so callers may mutate it
+            without copying.
         """
         # Try to get template for business adapters
-        template = None
-        if templates_dir:
-            template = self.template_manager.get_template(adapter_id, templates_dir)
-        else:
-            template = self.template_manager.get_template(adapter_id)
+        template = self._get_type_600_template(adapter_id, templates_dir)
 
         if template and adapter_id in BUSINESS_ADAPTERS:
-            # Use the correct template for business adapters
-            endpoint = template.copy()
-
-            # Update with our specific values
-            endpoint['id'] = endpoint_id
-            endpoint['checksum'] = DEFAULT_PROPERTIES['CHECKSUM']
-            endpoint['metadataVersion'] = DEFAULT_PROPERTIES['METADATA_VERSION']
-            endpoint['encryptedAtRest'] = True
-            endpoint['passwordEncAtAppLevel'] = True
-            endpoint['validationState'] = DEFAULT_PROPERTIES['VALIDATION_STATE']
-            endpoint['hidden'] = False
-            endpoint['requiresDeploy'] = True
-
-            return endpoint
+            # Use the correct template for business adapters, with our specific values merged in
+            # Deep copy so endpoints never share nested properties with the template or each other
+            return {**copy.deepcopy(template), 'id': endpoint_id, **_BUSINESS_TYPE_600_FIELDS}
 
         else:
             # Fallback for tempstorage or when templates not available
             # Use proper capitalization mapping instead of .title()
             endpoint_name = f"{get_adapter_display_name(adapter_id)} Endpoint"
 
-            return {
-                "name": endpoint_name,
-                "isFileBased": True,
-                "properties": self._create_default_properties(),
-                "type": COMPONENT_TYPES['CONNECTION'],
-                "adapterId": adapter_id,
-                "id": endpoint_id,
-                "checksum": DEFAULT_PROPERTIES['CHECKSUM'],
-                "metadataVersion": DEFAULT_PROPERTIES['METADATA_VERSION'],
-                "encryptedAtRest": True,
-                "passwordEncAtAppLevel": True,
-                "validationState": DEFAULT_PROPERTIES['VALIDATION_STATE'],
-                "hidden": False,
-                "requiresDeploy": True
-            }
+            endpoint = _FALLBACK_TYPE_600_TEMPLATE.copy()
+            endpoint.update(
+                name=endpoint_name,
+                properties=self._create_default_properties(),
+                adapterId=adapter_id,
+                id=endpoint_id
+            )
+            return endpoint
+
+    def _get_type_600_template(self, adapter_id: str, templates_dir: str = None) -> Optional[Dict[str, Any]]:
+        """
+        Get the Type 600 template for an adapter, fetching it once per (adapter_id, templates_dir).
+
+        TemplateManager only caches the default templates directory, so without this a
+        custom directory would be re-read for every endpoint.
+
+        Args:
+            adapter_id: Adapter identifier
+            templates_dir: Directory containing template files (optional)
+
+        Returns:
+            Template dictionary or None if not found/using fallback
+        """
+        key = (adapter_id, templates_dir)
+        if key not in self._type_600_templates:
+            if templates_dir:
+                self._type_600_templates[key] = self.template_manager.get_template(adapter_id, templates_dir)
+            else:
+                self._type_600_templates[key] = self.template_manager.get_template(adapter_id)
+        return self._type_600_templates[key]
 
     def create_type_500(self, name: str, polarity: str, adapter_id: str,
                        function_name: str, endpoint_id: str,
@@ -115,87 +242,86 @@ class EndpointFactory:
         Returns:
             Dictionary representing Type 500 endpoint component
         """
-        # Use v321-compatible structure for tempstorage
-        if adapter_id == "tempstorage":
-            return {
-                "name": name,
-                "kind": "outbound" if polarity == "source" else "inbound",
-                "discoveryType": "FileBasedDiscovery",
-                "polarity": polarity,
-                "inputRequired": False,
-                "properties": self._create_tempstorage_properties(polarity),
-                "pageStatus": [{"configured": True, "visited": True}, {"configured": True}],
-                "partial": False,
-                "functionName": function_name,
-                "type": COMPONENT_TYPES['ENDPOINT'],
-                "adapterId": adapter_id,
-                "endpoint": {"id": endpoint_id, "type": COMPONENT_TYPES['CONNECTION']},
-                "id": component_id,
-                "checksum": DEFAULT_PROPERTIES['CHECKSUM'],
-                "metadataVersion": DEFAULT_PROPERTIES['METADATA_VERSION'],
-                "encryptedAtRest": True,
-                "passwordEncAtAppLevel": True,
-                "validationState": DEFAULT_PROPERTIES['VALIDATION_STATE'],
-                "hidden": False,
-                "isSchemaDiscovered": True,
-                "isConfigurationComplete": True,
-                "requiresDeploy": True,
-                "plugins": [],
-                "chunks": 1
-            }
+        # adapterId/functionName become the converter's endpoint lookup keys; intern them so
+        # every endpoint shares one string object per value and key comparisons are by identity
+        if isinstance(adapter_id, str):
+            adapter_id = sys.intern(adapter_id)
+        if isinstance(function_name, str):
+            function_name = sys.intern(function_name)
+
+        # Adapters with their own structure (tempstorage, NetSuite); others use the standard structure
+        builder = self._TYPE_500_BUILDERS.get(adapter_id, EndpointFactory._create_standard_type_500)
+        return builder(self, name, polarity, adapter_id, function_name, endpoint_id, component_id, object_name)
+
+    def _create_tempstorage_type_500(self, name: str, polarity: str, adapter_id: str,
+                                     function_name: str, endpoint_id: str,
+                                     component_id: str, object_name: str = None) -> Dict[str, Any]:
+        """
+        Create a tempstorage Type 500 endpoint with the v321-compatible structure.
 
-        # NetSuite connector function - requires special structure
-        if adapter_id == "netsuite":
-            return self._create_netsuite_type_500(
-                name=name,
-                polarity=polarity,
-                function_name=function_name,
-                endpoint_id=endpoint_id,
-                component_id=component_id,
-                object_name=object_name or "Contact"  # Default to Contact
-            )
+        Args:
+            name: Name of the endpoint
+            polarity: Polarity ('source' or 'target')
+            adapter_id: Adapter identifier ('tempstorage')
+            function_name: Function name for the endpoint
+            endpoint_id: Associated Type 600 endpoint ID
+            component_id: Unique component identifier
+            object_name: Unused (same signature as the other Type 500 builders)
 
-        # For other non-tempstorage adapters, use standard structure
-        return {
-            "name": name,
-            "kind": "inbound" if polarity == "source" else "outbound",
-            "discoveryType": "FileBasedDiscovery",
-            "polarity": polarity,
-            "properties": self._create_default_properties(),
-            "pageStatus": [
-                {
-                    "configured": True,
-                    "visited": True
-                },
-                {
-                    "configured": True
-                }
-            ],
-            "functionName": function_name,
-            "type": COMPONENT_TYPES['ENDPOINT'],
-            "adapterId": adapter_id,
-            "endpoint": {
-                "id": endpoint_id,
-                "type": COMPONENT_TYPES['CONNECTION']
-            },
-            "id": component_id,
-            "checksum": DEFAULT_PROPERTIES['CHECKSUM'],
-            "metadataVersion": DEFAULT_PROPERTIES['METADATA_VERSION'],
-            "encryptedAtRest": True,
-            "passwordEncAtAppLevel": True,
-            "validationState": DEFAULT_PROPERTIES['VALIDATION_STATE'],
-            "hidden": False,
-            "isSchemaDiscovered": True,
-            "isConfigurationComplete": True,
-            "requiresDeploy": True,
-            "plugins": [],
-            "chunks": 1,
-            "partial": False
-        }
+        Returns:
+            Dictionary representing tempstorage Type 500 endpoint component
+        """
+        endpoint = _TEMPSTORAGE_TYPE_500_TEMPLATE.copy()
+        endpoint.update(
+            name=name,
+            # Deliberately the reverse of the standard mapping (v321 reference structure)
+            kind="outbound" if polarity == "source" else "inbound",
+            polarity=polarity,
+            properties=self._create_tempstorage_properties(polarity),
+            pageStatus=[{"configured": True, "visited": True}, {"configured": True}],
+            functionName=function_name,
+            endpoint={"id": endpoint_id, "type": _CONNECTION_TYPE},
+            id=component_id,
+            plugins=[]
+        )
+        return endpoint
+
+    def _create_standard_type_500(self, name: str, polarity: str, adapter_id: str,
+                                  function_name: str, endpoint_id: str,
+                                  component_id: str, object_name: str = None) -> Dict[str, Any]:
+        """
+        Create a Type 500 endpoint with the standard structure (adapters without a dedicated builder).
 
-    def _create_netsuite_type_500(self, name: str, polarity: str,
+        Args:
+            name: Name of the endpoint
+            polarity: Polarity ('source', 'target', 'neutral')
+            adapter_id: Adapter identifier
+            function_name: Function name for the endpoint
+            endpoint_id: Associated Type 600 endpoint ID
+            component_id: Unique component identifier
+            object_name: Unused (same signature as the other Type 500 builders)
+
+        Returns:
+            Dictionary representing Type 500 endpoint component
+        """
+        endpoint = _TYPE_500_TEMPLATE.copy()
+        endpoint.update(
+            name=name,
+            kind="inbound" if polarity == "source" else "outbound",
+            polarity=polarity,
+            properties=self._create_default_properties(),
+            pageStatus=[{"configured": True, "visited": True}, {"configured": True}],
+            functionName=function_name,
+            adapterId=adapter_id,
+            endpoint={"id": endpoint_id, "type": _CONNECTION_TYPE},
+            id=component_id,
+            plugins=[]
+        )
+        return endpoint
+
+    def _create_netsuite_type_500(self, name: str, polarity: str, adapter_id: str,
                                    function_name: str, endpoint_id: str,
-                                   component_id: str, object_name: str) -> Dict[str, Any]:
+                                   component_id: str, object_name: str = None) -> Dict[str, Any]:
         """
         Create a NetSuite Type 500 connector activity with proper structure.
 
@@ -205,16 +331,17 @@ class EndpointFactory:
         Args:
             name: Activity name
             polarity: Polarity ('source', 'target', 'neutral')
+            adapter_id: Adapter identifier ('netsuite')
             function_name: Function name (e.g., 'upsert', 'query')
             endpoint_id: Associated Type 600 endpoint ID
             component_id: Unique component identifier
-            object_name: NetSuite object name (e.g., 'Contact', 'Customer')
+            object_name: NetSuite object name (e.g., 'Contact', 'Customer'); defaults to 'Contact'
 
         Returns:
             Dictionary representing NetSuite Type 500 endpoint component
         """
-        # Get metadata for NetSuite Type 500
-        metadata = create_endpoint_metadata("netsuite", 500)
+        # Get metadata for NetSuite Type 500 (flat dict of constants, computed once; copied per endpoint)
+        metadata = dict(_cached_endpoint_metadata("netsuite", 500))
 
         return {
             "kind": "outbound",
@@ -233,20 +360,20 @@ class EndpointFactory:
                 }
             ],
             "metadata": metadata,
-            "properties": self._create_netsuite_properties(object_name),
+            "properties": self._create_netsuite_properties(object_name or "Contact"),
             "functionName": function_name,
-            "type": COMPONENT_TYPES['ENDPOINT'],
+            "type": _ENDPOINT_TYPE,
             "adapterId": "netsuite",
             "endpoint": {
                 "id": endpoint_id,
-                "type": COMPONENT_TYPES['CONNECTION']
+                "type": _CONNECTION_TYPE
             },
             "id": component_id,
-            "checksum": DEFAULT_PROPERTIES['CHECKSUM'],
+            "checksum": _CHECKSUM,
             "requiresDeploy": True,
-            "metadataVersion": DEFAULT_PROPERTIES['METADATA_VERSION'],
+            "metadataVersion": _METADATA_VERSION,
             "encryptedAtRest": True,
-            "validationState": DEFAULT_PROPERTIES['VALIDATION_STATE'],
+            "validationState": _VALIDATION_STATE,
             "hidden": False,
             "isSchemaDiscovered": True,
             "pageStatus": [
@@ -310,38 +437,9 @@ class EndpointFactory:
         Create default properties array for endpoints.
 
         Returns:
-            List of property dictionaries with default values
+            List of property dictionaries with default values (fresh copies of _DEFAULT_PROPERTIES_TEMPLATE)
         """
-        return [
-            {
-                "type": "string",
-                "multiple": False,
-                "name": "entityId",
-                "hidden": True,
-                "defaultValue": DEFAULT_PROPERTIES['ENTITY_ID']
-            },
-            {
-                "type": "string",
-                "multiple": False,
-                "name": "source_type_id",
-                "hidden": True,
-                "defaultValue": DEFAULT_PROPERTIES['SOURCE_TYPE_ID']
-            },
-            {
-                "type": "string",
-                "multiple": False,
-                "name": "target_type_id",
-                "hidden": True,
-                "defaultValue": DEFAULT_PROPERTIES['TARGET_TYPE_ID']
-            },
-            {
-                "type": "string",
-                "multiple": False,
-                "name": "file_share_id",
-                "hidden": True,
-                "defaultValue": DEFAULT_PROPERTIES['FILE_SHARE_ID']
-            }
-        ]
+        return [prop.copy() for prop in _DEFAULT_PROPERTIES_TEMPLATE]
 
     def validate_endpoint(self, endpoint: Dict[str, Any], expected_type: int) -> bool:
         """
@@ -357,22 +455,17 @@ class EndpointFactory:
         if not isinstance(endpoint, dict):
             return False
 
-        # Check required fields
-        required_fields = ['id', 'type', 'name']
-        for field in required_fields:
-            if field not in endpoint:
-                return False
-
-        # Check type matches expected
-        if endpoint.get('type') != expected_type:
+        # Check required fields (Type 500 also needs polarity and functionName)
+        if expected_type == _ENDPOINT_TYPE:
+            required_fields = _REQUIRED_TYPE_500_FIELDS
+        else:
+            required_fields = _REQUIRED_ENDPOINT_FIELDS
+        if not required_fields.issubset(endpoint.keys()):
             return False
 
-        # Type-specific validation
-        if expected_type == COMPONENT_TYPES['ENDPOINT']:  # Type 500
-            if 'polarity' not in endpoint or 'functionName' not in endpoint:
-                return False
+        # Check type matches expected
+        return endpoint['type'] == expected_type
 
-        return True
     def _create_tempstorage_properties(self, polarity):
         """Create v321-style tempstorage properties with exact pagination structure."""
         return [
@@ -411,3 +504,9 @@ class EndpointFactory:
                 ]
             }
         ]
+
+    # Type 500 builders for adapters with a dedicated structure (see create_type_500)
+    _TYPE_500_BUILDERS = {
+        "tempstorage": _create_tempstorage_type_500,
+        "netsuite": _create_netsuite_type_500
+    }
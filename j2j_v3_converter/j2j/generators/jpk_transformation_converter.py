@@ -15,14 +15,174 @@ Type ID to Adapter Mapping:
   1,4 → user/canonical schema (no adapterId)
 """
 
-import json
 import re
 import uuid
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+
+from ..config.transformation_rules import (
+    get_adapter_id as _rule_get_adapter_id,
+    get_direction as _rule_get_direction,
+    is_flat_schema as _rule_is_flat_schema,
+    should_keep_numeric_segment as _rule_should_keep_numeric_segment,
+    NAVIGATION_PREFIXES,
+    COLLECTION_ROOTS,
+    VARIABLE_REFERENCE_PATTERN,
+    should_skip_precondition_generation as _rule_should_skip_precondition,
+    map_flat_schema_target_path as _rule_map_flat_target_path,
+    should_skip_root_translation as _rule_should_skip_root_translation,
+    SALESFORCE_ROOT_TRANSLATIONS,
+    get_flat_schema_field_name as _rule_get_flat_field_name,
+    get_flat_schema_name as _rule_get_flat_schema_name
+)
+from ..utils.json_compat import load_json_bytes
+
+# Type 700 transformation template. None marks per-transformation fields set in
+# _convert_single_transformation (except 'description', which stays None); the template
+# also fixes the output key order. Mutable values (options, notes, *NodesInfo) are
+# created fresh per transformation.
+_TRANSFORMATION_TEMPLATE = {
+    'id': None,
+    'name': None,
+    'type': 700,
+    'entityTypeId': '4',
+    'checksum': '1',
+    'requiresDeploy': True,
+    'source': None,
+    'target': None,
+    'mappingRules': None,
+    'loopMappingRules': None,
+    'options': None,
+    'description': None,
+    'notes': None,
+    'metadataVersion': '3.0.1',
+    'chunks': 1,
+    'partial': False,
+    'encryptedAtRest': True,
+    'duplicateNodesInfo': None,
+    'srcExtendedNodesInfo': None,
+    'tgtExtendedNodesInfo': None,
+    '_conversion_metadata': None
+}
+
+# Flat schema field (N is set per schema; the placeholder keeps its key position)
+_FLAT_FIELD_TEMPLATE = {
+    'NIL': False,
+    'MN': 0,
+    'MX': 1,
+    'N': None,
+    'T': 'string',
+    'DV': '',
+    'DT': '1',
+    'BG': -1,
+    'EN': -1,
+    'I': 1,
+    'L': 1
+}
+
+# Flat schema document options. Shared by every flat document - read-only (consumers
+# replace 'O' rather than mutate it); a plain dict so it serializes with json/orjson.
+_FLAT_SCHEMA_OPTIONS = {
+    'customSchemaIsFlat': True,
+    'isCustomSchema': True,
+    'isFixedSchema': False,
+    'delimiter': ',',
+    'text_qualifier': '"',
+    'qualifier_mode': 'WHEN_NEEDED',
+    'use_end_of_line': True,
+    'escape_sequences': True
+}
+
+# Salesforce embedded schema document options (shared read-only, like _FLAT_SCHEMA_OPTIONS)
+_SALESFORCE_DOCUMENT_OPTIONS = {
+    'isCustomSchema': True,
+    'customSchemaIsFlat': False,
+    'customSchemaIsXml': True,
+    'customSchemaIsFlatComplex': False
+}
+
+# Common JTR occurrence attribute values (strings from XML, or ints); -1 means unbounded
+_JTR_MAX_OCCURS = {'-1': 'unbounded', '0': 0, '1': 1, -1: 'unbounded', 0: 0, 1: 1}
+_JTR_MIN_OCCURS = {'0': 0, '1': 1, 0: 0, 1: 1}
+
+# Precompiled patterns for field labels, path notation and mapping script analysis
+_CAMEL_CASE_BOUNDARY_RE = re.compile(r'([a-z])([A-Z])')
+_PRESCRIPT_DOUBLE_SLASH_SUFFIX_RE = re.compile(r'//PRESCRIPT/?$')
+_PRESCRIPT_SUFFIX_RE = re.compile(r'/PRESCRIPT/?$')
+_PRESCRIPT_SCRIPT_SUFFIX_RE = re.compile(r'\$?/PRESCRIPT/?$')
+_EXTRA_SLASHES_RE = re.compile(r'//{3,}')
+_JBROOT_PATH_RE = re.compile(r'jbroot\$[^\s\)\;\+\=]+')
+_VARIABLE_REFERENCE_RE = re.compile(VARIABLE_REFERENCE_PATTERN)
+_NUMERIC_LITERAL_RE = re.compile(r'^-?\d+\.?\d*$')
+_LOCAL_VARIABLE_RE = re.compile(r'^[a-z][a-zA-Z0-9_]*;?$')
+_SOURCE_SEGMENT_SEPARATOR_RE = re.compile(r'[\$\.#]')
+_IDENTIFIER_RE = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+_TRAILING_CALL_ARGUMENT_RE = re.compile(r'\(([^()]+)\)\s*$')
+
+# Canonical → runtime root prefixes for Salesforce-origin schemas:
+# JPK scripts (_translate_jpk_root) ...
+_CANONICAL_TO_RUNTIME_SCRIPT_PREFIXES = (
+    ('Contacts$', 'records$'),
+    ('Contacts.', 'records.'),
+)
+_CANONICAL_SCRIPT_PREFIXES = tuple(canonical for canonical, _ in _CANONICAL_TO_RUNTIME_SCRIPT_PREFIXES)
+# ... and loop paths (_extract_loop_mapping_rules): (canonical$, runtime$, canonical/, runtime/)
+_SALESFORCE_LOOP_PREFIXES = tuple(
+    (f"{canonical}$", f"{runtime}$", f"{canonical}/", f"{runtime}/")
+    for canonical, runtime in SALESFORCE_ROOT_TRANSLATIONS.items()
+)
+
+# UUID5 namespace for deterministic transformation/schema IDs (same namespace as SchemaGenerator)
+_GUID_NAMESPACE = uuid.UUID('a3bb189e-8bf9-3888-9912-ace4e6543002')
+
+# JPK type code -> (min_occurs, max_occurs) for fields without JTR occurrence data
+_OCCURS_BY_TYPE_CODE = {
+    '0x1': (1, 1),           # Required single
+    '0x9': (0, 'unbounded'), # Optional array
+    '0x24': (0, 1),          # Optional single
+    '0x21': (1, 1),          # Required single
+}
+
+# JPK value type -> JSON document type
+_VALUE_TYPE_MAP = {
+    '8': 'string',
+    '4': 'int',
+    '5': 'double',
+    '6': 'boolean',
+    '7': 'date'
+}
+
+
+@lru_cache(maxsize=4096)
+def _field_label(field_name: str) -> str:
+    """Generate human-readable label from field name (pure; field names repeat across schemas)."""
+    # Remove prefixes
+    name = field_name.replace('typ', '').replace('xsi:', '')
+
+    # CamelCase to spaces
+    name = _CAMEL_CASE_BOUNDARY_RE.sub(r'\1 \2', name)
+
+    # Underscores to spaces
+    name = name.replace('_', ' ').replace('  ', ' ')
+    name = name.replace('__c', '').strip()
+
+    return name.title()
+
+
+def _schema_file_base(schema_file: str) -> str:
+    """Strip a trailing .xsd/.xml extension from a JPK schema file name (e.g. 'jb-canonical-contact.xsd')."""
+    return schema_file[:-4] if schema_file.endswith(('.xsd', '.xml')) else schema_file
 
 
 class JPKTransformationConverter:
-    """Converts JPK transformation data to Jitterbit JSON format."""
+    """
+    Converts JPK transformation data to Jitterbit JSON format.
+
+    Embedded schema documents loaded from schema_references are shared, not
+    deep-copied: treat transformation 'document' values as read-only.
+    """
     
     def __init__(self):
         """Initialize the converter."""
@@ -31,36 +191,18 @@ class JPKTransformationConverter:
         self._current_source_root = None
         self._current_target_root = None
         self._current_salesforce_object_name = None
-        # Import transformation rules
-        from ..config.transformation_rules import (
-            get_adapter_id, get_function_name, get_direction,
-            is_flat_schema, get_schema_format, should_keep_numeric_segment,
-            NAVIGATION_PREFIXES, COLLECTION_ROOTS, VARIABLE_REFERENCE_PATTERN,
-            should_remove_source_origin, should_skip_precondition_generation,
-            map_flat_schema_target_path, should_use_origin_reference,
-            should_skip_root_translation, get_root_translation, SALESFORCE_ROOT_TRANSLATIONS,
-            get_flat_schema_field_name, get_flat_schema_name, USE_JPK_FLAT_FIELD_NAMES
+        # Reference schema files: list the directory once so lookups are set membership, not stat() calls
+        self._schema_refs_dir = Path(__file__).resolve().parent.parent.parent / 'schema_references'
+        self._schema_refs_index = (
+            frozenset(p.name for p in self._schema_refs_dir.iterdir())
+            if self._schema_refs_dir.is_dir() else frozenset()
         )
-        # Store rule functions as instance methods
-        self._rule_get_adapter_id = get_adapter_id
-        self._rule_get_function_name = get_function_name
-        self._rule_get_direction = get_direction
-        self._rule_is_flat_schema = is_flat_schema
-        self._rule_get_schema_format = get_schema_format
-        self._rule_should_keep_numeric_segment = should_keep_numeric_segment
-        self._navigation_prefixes = NAVIGATION_PREFIXES
-        self._collection_roots = COLLECTION_ROOTS
-        self._variable_pattern = VARIABLE_REFERENCE_PATTERN
-        self._rule_should_remove_source_origin = should_remove_source_origin
-        self._rule_should_skip_precondition = should_skip_precondition_generation
-        self._rule_map_flat_target_path = map_flat_schema_target_path
-        self._rule_should_use_origin = should_use_origin_reference
-        self._rule_should_skip_root_translation = should_skip_root_translation
-        self._rule_get_root_translation = get_root_translation
-        self._salesforce_root_translations = SALESFORCE_ROOT_TRANSLATIONS
-        self._rule_get_flat_field_name = get_flat_schema_field_name
-        self._rule_get_flat_schema_name = get_flat_schema_name
-        self._use_jpk_flat_field_names = USE_JPK_FLAT_FIELD_NAMES
+        # Parsed reference documents by file name (see _load_ref_document)
+        self._ref_doc_cache = {}
+        # id()s of cached reference documents whose source has no PRESCRIPT node (filter is a no-op)
+        self._prescript_free_ref_docs = set()
+        # _build_path_index results for canonical target reference documents, by file name
+        self._ref_path_indexes = {}
 
     @staticmethod
     def _filter_prescript_nodes(schema_doc: Dict[str, Any]) -> Dict[str, Any]:
@@ -74,35 +216,82 @@ class JPKTransformationConverter:
             schema_doc: Schema document with 'root' key
 
         Returns:
-            Filtered schema document
+            Filtered schema document (copy-on-write: nodes without PRESCRIPT
+            descendants, and the document itself if nothing was removed, are
+            returned as-is rather than copied)
         """
         if not schema_doc or not isinstance(schema_doc, dict):
             return schema_doc
 
         def filter_children(node: Dict[str, Any]) -> Dict[str, Any]:
-            """Recursively filter PRESCRIPT nodes from children."""
-            if not isinstance(node, dict):
+            """Filter PRESCRIPT nodes from a subtree, copying only changed nodes."""
+            if not isinstance(node, dict) or not isinstance(node.get('C'), list):
                 return node
 
-            # Filter children if present
-            if 'C' in node and isinstance(node['C'], list):
-                filtered_children = []
-                for child in node['C']:
+            # Iterative post-order walk (deep schemas would otherwise recurse per level).
+            # The current node's state lives in locals; ancestors' state is on the stack.
+            stack = []
+            children = iter(node['C'])
+            filtered_children = []
+            changed = False
+            while True:
+                for child in children:
                     # Skip PRESCRIPT nodes
                     child_name = child.get('N', '') if isinstance(child, dict) else ''
                     if 'PRESCRIPT' in child_name:
+                        changed = True
                         continue
-                    # Recursively filter nested children
-                    filtered_children.append(filter_children(child))
-                node = dict(node)  # Make a copy
-                node['C'] = filtered_children
+                    # Descend into nested children; this node resumes when the child is done
+                    if isinstance(child, dict) and isinstance(child.get('C'), list):
+                        stack.append((node, children, filtered_children, changed))
+                        node, children, filtered_children, changed = child, iter(child['C']), [], False
+                        break
+                    filtered_children.append(child)
+                else:
+                    # All children handled: rebuild this node only if something changed
+                    filtered = {**node, 'C': filtered_children} if changed else node
+                    if not stack:
+                        return filtered
+                    child_changed = changed
+                    node, children, filtered_children, changed = stack.pop()
+                    filtered_children.append(filtered)
+                    changed = changed or child_changed
+
+        if 'root' not in schema_doc:
+            return schema_doc
+        root = schema_doc['root']
+        filtered_root = filter_children(root)
+        if filtered_root is root:
+            return schema_doc
+        return {**schema_doc, 'root': filtered_root}
 
-            return node
+    def _load_ref_document(self, ref_file: str) -> Dict[str, Any]:
+        """
+        Load a schema_references JSON document, parsing each file only once.
 
-        result = dict(schema_doc)  # Make a copy
-        if 'root' in result:
-            result['root'] = filter_children(result['root'])
-        return result
+        The returned document is shared between callers and must not be mutated.
+
+        Args:
+            ref_file: File name inside the schema_references directory
+
+        Returns:
+            Parsed JSON document
+
+        Raises:
+            OSError, ValueError: If the file cannot be read or parsed (not cached)
+        """
+        try:
+            return self._ref_doc_cache[ref_file]
+        except KeyError:
+            pass
+        raw = (self._schema_refs_dir / ref_file).read_bytes()
+        ref_data = load_json_bytes(raw)
+        self._ref_doc_cache[ref_file] = ref_data
+        # No PRESCRIPT in the raw bytes (and no \u escapes that could spell it) means
+        # _filter_prescript_nodes has nothing to remove; the cache keeps the id() valid
+        if b'PRESCRIPT' not in raw and b'\\u' not in raw:
+            self._prescript_free_ref_docs.add(id(ref_data))
+        return ref_data
 
     def _get_adapter_id(self, type_id: str) -> Optional[str]:
         """
@@ -114,7 +303,7 @@ class JPKTransformationConverter:
         Returns:
             adapterId if connector schema, None for user/canonical schemas
         """
-        return self._rule_get_adapter_id(type_id)
+        return _rule_get_adapter_id(type_id)
     
     def convert_transformations_from_jpk_discovery(self, jpk_discovery_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -139,11 +328,12 @@ class JPKTransformationConverter:
 
         name = jpk_transform['name']
         jpk_id = jpk_transform['id']
+        source_info = jpk_transform.get('source') or {}
+        target_info = jpk_transform.get('target') or {}
+        mappings = jpk_transform.get('mappings') or []
 
         # Set transformation context for path translation decisions
         # This context is used by _convert_path_notation to determine if root translation is needed
-        source_info = jpk_transform.get('source', {})
-        target_info = jpk_transform.get('target', {})
         self._current_source_root = source_info.get('root')  # e.g., "{namespace}Contacts" or "records"
         self._current_target_root = target_info.get('root')  # e.g., "{namespace}Contacts" or "upsertList"
         self._current_salesforce_object_name = source_info.get('salesforce_object_name')  # e.g., "Contact" or None
@@ -153,74 +343,64 @@ class JPKTransformationConverter:
 
         # Convert source schema
         source = self._convert_schema(
-            jpk_transform.get('source', {}),
+            source_info,
             'source',
             transformation_name=name
         )
 
         # Convert target schema
         target = self._convert_schema(
-            jpk_transform.get('target', {}),
+            target_info,
             'target',
             transformation_name=name
         )
 
         # Convert mapping rules (pass target schema to detect flat schemas)
         # Extract flat_field_names from target schema for REQ-009
-        target_jpk_schema = jpk_transform.get('target', {})
         flat_field_names = None
-        if target_jpk_schema:
-            field_structure = target_jpk_schema.get('field_structure', {})
+        if target_info:
+            field_structure = target_info.get('field_structure', {})
             if field_structure.get('is_flat') and field_structure.get('flat_fields'):
                 flat_field_names = field_structure.get('flat_fields')
 
         mapping_rules = self._convert_mapping_rules(
-            jpk_transform.get('mappings', []),
-            target_schema=target_jpk_schema,
+            mappings,
+            target_schema=target_info,
             flat_field_names=flat_field_names
         )
         
         # Extract loop mapping rules from JPK mappings
-        loop_mapping_rules = self._extract_loop_mapping_rules(
-            jpk_transform.get('mappings', [])
-        )
-        
-        return {
-            'id': new_id,
-            'name': name,
-            'type': 700,
-            'entityTypeId': '4',
-            'checksum': '1',
-            'requiresDeploy': True,
-            'source': source,
-            'target': target,
-            'mappingRules': mapping_rules,
-            'loopMappingRules': loop_mapping_rules,  # Integration Studio's getSourceMappedLoopPath expects this field
-            'options': {},
-            'description': None,
-            'notes': [],
-            'metadataVersion': '3.0.1',
-            'chunks': 1,
-            'partial': False,
-            'encryptedAtRest': True,
-            'duplicateNodesInfo': {
+        loop_mapping_rules = self._extract_loop_mapping_rules(mappings)
+        
+        transformation = _TRANSFORMATION_TEMPLATE.copy()
+        transformation.update(
+            id=new_id,
+            name=name,
+            source=source,
+            target=target,
+            mappingRules=mapping_rules,
+            loopMappingRules=loop_mapping_rules,  # Integration Studio's getSourceMappedLoopPath expects this field
+            options={},
+            notes=[],
+            duplicateNodesInfo={
                 'duplicatedNodes': {},
                 'removedNodes': {}
             },
-            'srcExtendedNodesInfo': {
+            srcExtendedNodesInfo={
                 'extendedNodes': {},
                 'removedNodes': {}
             },
-            'tgtExtendedNodesInfo': {
+            tgtExtendedNodesInfo={
                 'extendedNodes': {},
                 'removedNodes': {}
             },
-            '_conversion_metadata': {
+            _conversion_metadata={
                 'original_jpk_id': jpk_id,
                 'source': 'jpk_discovery',
                 'mapping_count': len(mapping_rules)
             }
-        }
+        )
+        return transformation
     
     def _convert_schema(self, jpk_schema: Dict[str, Any], schema_type: str, 
                        for_component: bool = False, transformation_name: str = None) -> Dict[str, Any]:
@@ -281,52 +461,44 @@ class JPKTransformationConverter:
         
         # PRIORITY 0: Try transformation-specific reference files FIRST
         # These have complete structure with name, O, types - critical for validation
-        jpk_root = jpk_schema.get('root', '')
-        has_namespace_root = '}' in str(jpk_root)  # Namespace format: {http://...}ElementName
+        jpk_root = jpk_schema.get('root') or ''
+        has_namespace_root = isinstance(jpk_root, str) and '}' in jpk_root  # Namespace format: {http://...}ElementName
 
         # For canonical schemas (with namespace root), try to load canonical schema reference
         if has_namespace_root and not is_connector:
-            from pathlib import Path
-            schema_refs_dir = Path(__file__).parent.parent.parent / 'schema_references'
-            if schema_refs_dir.exists():
+            if self._schema_refs_index:
                 # Extract schema file name from JPK schema (e.g., 'jb-canonical-contact.xsd')
                 target_xml = jpk_schema.get('schema', '')
                 if target_xml:
                     # Try exact match first: jb-canonical-contact.json
-                    schema_base = target_xml.replace('.xsd', '').replace('.xml', '')
+                    schema_base = _schema_file_base(target_xml)
                     ref_file = f"{schema_base}.json"
-                    ref_path = schema_refs_dir / ref_file
-                    if ref_path.exists():
+                    if ref_file in self._schema_refs_index:
+                        ref_path = self._schema_refs_dir / ref_file
                         try:
-                            import json
-                            with open(ref_path, 'r') as f:
-                                ref_data = json.load(f)
-                                if 'root' in ref_data:
-                                    document = ref_data
-                                    schema_name = ref_data.get('name', schema_base)
-                                    print(f"         📋 Loaded canonical schema from reference: {ref_file}")
+                            ref_data = self._load_ref_document(ref_file)
+                            if 'root' in ref_data:
+                                document = ref_data
+                                schema_name = ref_data.get('name', schema_base)
+                                print(f"         📋 Loaded canonical schema from reference: {ref_file}")
                         except Exception as e:
                             print(f"         ⚠️ Error loading canonical reference file {ref_path}: {e}")
 
         # For non-canonical schemas, try transformation-specific reference files
         if transformation_name and schema_type and not is_connector and not has_namespace_root and document is None:
-            from pathlib import Path
-            schema_refs_dir = Path(__file__).parent.parent.parent / 'schema_references'
-            if schema_refs_dir.exists():
+            if self._schema_refs_index:
                 trans_clean = transformation_name.replace(' ', '_').replace('-', '_')
                 ref_file = f"{trans_clean}_{schema_type}_document.json"
-                ref_path = schema_refs_dir / ref_file
-                if ref_path.exists():
+                if ref_file in self._schema_refs_index:
+                    ref_path = self._schema_refs_dir / ref_file
                     try:
-                        import json
-                        with open(ref_path, 'r') as f:
-                            ref_data = json.load(f)
-                            if 'root' in ref_data:
-                                document = ref_data
-                                # Update schema_name to match the reference file's name
-                                if ref_data.get('name'):
-                                    schema_name = ref_data['name']
-                                print(f"         📋 Loaded inline document from reference: {ref_file}")
+                        ref_data = self._load_ref_document(ref_file)
+                        if 'root' in ref_data:
+                            document = ref_data
+                            # Update schema_name to match the reference file's name
+                            if ref_data.get('name'):
+                                schema_name = ref_data['name']
+                            print(f"         📋 Loaded inline document from reference: {ref_file}")
                     except Exception as e:
                         print(f"         ⚠️ Error loading reference file {ref_path}: {e}")
         
@@ -353,15 +525,9 @@ class JPKTransformationConverter:
                     salesforce_object_name = jpk_schema.get('salesforce_object_name')
                     if salesforce_object_name:
                         # Salesforce embedded schema - add types, O, name
-                        friendly_name = self._generate_salesforce_schema_name(salesforce_object_name, 'output')
-                        document = {
-                            'root': root_json,
-                            'types': self._generate_salesforce_types(root_json, salesforce_object_name),
-                            'O': self._generate_salesforce_document_options(),
-                            'name': friendly_name
-                        }
+                        document = self._build_salesforce_document(root_json, salesforce_object_name)
                         # Also update schema_name to use friendly name
-                        schema_name = friendly_name
+                        schema_name = document['name']
                     else:
                         # Standard embedded schema - just root
                         document = {
@@ -430,7 +596,12 @@ class JPKTransformationConverter:
         elif document is not None:
             # Filter out PRESCRIPT nodes from embedded documents
             # /PRESCRIPT/ is a Design Studio marker that doesn't apply to Integration Studio
-            document = self._filter_prescript_nodes(document)
+            # (skipped for reference documents already known to contain none)
+            if id(document) not in self._prescript_free_ref_docs:
+                document = self._filter_prescript_nodes(document)
+            # NOTE: Embedded without a deep copy - reference documents are shared with
+            # _ref_doc_cache and other transformations. Consumers must copy before mutating
+            # (JPKConverter copies the document before adding O/jtr/types to a Type 900 schema).
             schema_dict['document'] = document
 
         return schema_dict
@@ -455,25 +626,13 @@ class JPKTransformationConverter:
             Document structure for flat schema
         """
         # Use rule-based field name (either JPK field or default based on config)
-        actual_field_name = self._rule_get_flat_field_name(flat_field_names)
+        actual_field_name = _rule_get_flat_field_name(flat_field_names)
 
         # Use rule-based schema name (either JPK name or default based on config)
-        actual_schema_name = self._rule_get_flat_schema_name(schema_name)
+        actual_schema_name = _rule_get_flat_schema_name(schema_name)
 
         # Create single field structure (flat schemas typically have one field)
-        children = [{
-            'NIL': False,
-            'MN': 0,
-            'MX': 1,
-            'N': actual_field_name,
-            'T': 'string',
-            'DV': '',
-            'DT': '1',
-            'BG': -1,
-            'EN': -1,
-            'I': 1,
-            'L': 1
-        }]
+        children = [{**_FLAT_FIELD_TEMPLATE, 'N': actual_field_name}]
 
         return {
             'name': actual_schema_name,
@@ -487,16 +646,7 @@ class JPKTransformationConverter:
                 'I': 0,
                 'L': 0
             },
-            'O': {
-                'customSchemaIsFlat': True,
-                'isCustomSchema': True,
-                'isFixedSchema': False,
-                'delimiter': ',',
-                'text_qualifier': '"',
-                'qualifier_mode': 'WHEN_NEEDED',
-                'use_end_of_line': True,
-                'escape_sequences': True
-            }
+            'O': _FLAT_SCHEMA_OPTIONS
         }
     
     def _generate_salesforce_document_options(self) -> Dict[str, Any]:
@@ -505,14 +655,28 @@ class JPKTransformationConverter:
         
         Returns:
             Document options dictionary matching baseline structure
+            (shared _SALESFORCE_DOCUMENT_OPTIONS - do not mutate)
+        """
+        return _SALESFORCE_DOCUMENT_OPTIONS
+    
+    def _build_salesforce_document(self, root_json: Dict[str, Any], object_name: str) -> Dict[str, Any]:
+        """
+        Build an embedded Salesforce schema document around an already converted root.
+
+        Args:
+            root_json: Root field in JSON document notation
+            object_name: Salesforce object name (e.g., 'Contact')
+
+        Returns:
+            Document with root, types, O and friendly name
         """
         return {
-            'isCustomSchema': True,
-            'customSchemaIsFlat': False,
-            'customSchemaIsXml': True,
-            'customSchemaIsFlatComplex': False
+            'root': root_json,
+            'types': self._generate_salesforce_types(root_json, object_name),
+            'O': _SALESFORCE_DOCUMENT_OPTIONS,
+            'name': self._generate_salesforce_schema_name(object_name, 'output')
         }
-    
+
     def _generate_salesforce_types(self, root: Dict[str, Any], object_name: str) -> List[Dict[str, Any]]:
         """
         Generate types array from root structure for Salesforce schemas.
@@ -611,8 +775,9 @@ class JPKTransformationConverter:
         """
         # Extract field name
         name = jpk_field.get('name', '')
-        # Build current path
-        current_path = f"{parent_path}.{name}" if parent_path else name
+        # Dotted path of this field; only needed for the records heuristic and for children,
+        # so it is built lazily (most JTR leaf fields need neither)
+        current_path = None
         
         # CRITICAL: Use actual min_occurs/max_occurs from JTR XML if available
         # The JTR cache file contains the correct occurrence constraints in the XML attributes
@@ -621,52 +786,42 @@ class JPKTransformationConverter:
         
         if jtr_min_occurs is not None or jtr_max_occurs is not None:
             # Use JTR values directly
-            # JTR XML attributes are strings, so convert them
-            # Convert None to appropriate defaults
-            if jtr_min_occurs is not None:
-                try:
-                    # Handle both string and int (XML attributes are strings)
-                    min_occurs = int(jtr_min_occurs) if isinstance(jtr_min_occurs, str) else int(jtr_min_occurs)
-                except (ValueError, TypeError):
-                    min_occurs = 0
-            else:
-                # Default min_occurs based on max_occurs
-                # Check if max_occurs is unbounded (-1 or string "-1")
-                if isinstance(jtr_max_occurs, str) and jtr_max_occurs == '-1':
-                    max_val = -1
-                else:
-                    max_val = int(jtr_max_occurs) if isinstance(jtr_max_occurs, str) else jtr_max_occurs
-                
-                if max_val == -1:
-                    # For unbounded arrays, check XSD pattern: typically minOccurs=1 for NetSuite operations
-                    # But we can't access XSD here, so use 1 as default (matches baseline)
-                    min_occurs = 1
-                elif isinstance(max_val, int) and max_val > 1:
-                    # For bounded arrays > 1, default to 0 (optional)
-                    min_occurs = 0
-                else:
-                    # For single elements (max=1), default to 1 (required)
-                    min_occurs = 1
-            
+            # JTR XML attributes are strings ('0', '1', '-1' cover almost every field), so those
+            # and their int forms resolve by lookup; anything else goes through int()
+
             # Handle max_occurs: convert -1 to "unbounded" string to match baseline
-            # JTR XML attributes are strings, so handle both string "-1" and int -1
-            if isinstance(jtr_max_occurs, str) and jtr_max_occurs == '-1':
-                max_occurs = 'unbounded'  # Baseline uses string "unbounded", not -1
-            elif jtr_max_occurs == -1:
-                max_occurs = 'unbounded'  # Baseline uses string "unbounded", not -1
-            elif jtr_max_occurs is not None:
-                try:
-                    # Handle both string and int
-                    max_occurs = int(jtr_max_occurs) if isinstance(jtr_max_occurs, str) else int(jtr_max_occurs)
-                except (ValueError, TypeError):
-                    max_occurs = 1
-            else:
+            if jtr_max_occurs is None:
                 max_occurs = 1
+            else:
+                max_occurs = _JTR_MAX_OCCURS.get(jtr_max_occurs)
+                if max_occurs is None:
+                    try:
+                        max_occurs = int(jtr_max_occurs)
+                    except (ValueError, TypeError):
+                        max_occurs = 1
+
+            if jtr_min_occurs is not None:
+                min_occurs = _JTR_MIN_OCCURS.get(jtr_min_occurs)
+                if min_occurs is None:
+                    try:
+                        min_occurs = int(jtr_min_occurs)
+                    except (ValueError, TypeError):
+                        min_occurs = 0
+            elif isinstance(max_occurs, int) and max_occurs > 1:
+                # Default min_occurs based on max_occurs: bounded arrays > 1 are optional
+                min_occurs = 0
+            else:
+                # Unbounded arrays: typically minOccurs=1 for NetSuite operations, but we can't
+                # access XSD here, so use 1 (matches baseline); single elements (max=1) are required
+                min_occurs = 1
         else:
             # Fall back to type inference if JTR doesn't have occurrence info
             # HEURISTIC: For Salesforce query responses, elements under "records" are typically repeating
             # Check if this field is a direct child of "records" (Salesforce query response root)
-            field_path = jpk_field.get('path', '') or current_path
+            field_path = jpk_field.get('path', '')
+            if not field_path:
+                current_path = f"{parent_path}.{name}" if parent_path else name
+                field_path = current_path
             is_records_child = (
                 (field_path.startswith('records.') and field_path.count('.') == 1) or
                 (parent_path == 'records')
@@ -701,6 +856,8 @@ class JPKTransformationConverter:
         # Recursively convert children
         children = jpk_field.get('children', [])
         if children:
+            if current_path is None:
+                current_path = f"{parent_path}.{name}" if parent_path else name
             json_field['C'] = [
                 self._convert_field_to_json_notation(child, current_path)
                 for child in children
@@ -726,41 +883,15 @@ class JPKTransformationConverter:
         Returns:
             Tuple of (min_occurs, max_occurs)
         """
-        type_mappings = {
-            '0x1': (1, 1),           # Required single
-            '0x9': (0, 'unbounded'), # Optional array
-            '0x24': (0, 1),          # Optional single
-            '0x21': (1, 1),          # Required single
-        }
-        
-        return type_mappings.get(type_code, (0, 1))  # Default: optional single
+        return _OCCURS_BY_TYPE_CODE.get(type_code, (0, 1))  # Default: optional single
     
     def _map_value_type(self, value_type: str) -> str:
         """Map JPK value type to JSON type."""
-        type_map = {
-            '8': 'string',
-            '4': 'int',
-            '5': 'double',
-            '6': 'boolean',
-            '7': 'date'
-        }
-        return type_map.get(str(value_type), 'string')
+        return _VALUE_TYPE_MAP.get(str(value_type), 'string')
     
     def _generate_label(self, field_name: str) -> str:
-        """Generate human-readable label from field name."""
-        import re
-        
-        # Remove prefixes
-        name = field_name.replace('typ', '').replace('xsi:', '')
-        
-        # CamelCase to spaces
-        name = re.sub(r'([a-z])([A-Z])', r'\1 \2', name)
-        
-        # Underscores to spaces
-        name = name.replace('_', ' ').replace('  ', ' ')
-        name = name.replace('__c', '').strip()
-        
-        return name.title()
+        """Generate human-readable label from field name (memoized, see _field_label)."""
+        return _field_label(field_name)
     
     def _create_origin(self, jpk_schema: Dict[str, Any], adapter_id: str, schema_type: str) -> Dict[str, Any]:
         """
@@ -787,7 +918,7 @@ class JPKTransformationConverter:
             function_name = jpk_schema.get('salesforce_function', 'query')
 
             # Use centralized direction from rules, which now includes type_id=12
-            direction = self._rule_get_direction(type_id) or 'output'
+            direction = _rule_get_direction(type_id) or 'output'
 
             # For type_id=12 (Request), default function to 'update' if not set
             if type_id == '12' and function_name == 'query':
@@ -840,7 +971,40 @@ class JPKTransformationConverter:
         # Keep for backwards compatibility but this should no longer be called
         return None
 
-    def _is_complex_element(self, document: Dict[str, Any], target_path: str) -> bool:
+    @staticmethod
+    def _build_path_index(document: Dict[str, Any]) -> Dict[Tuple[Any, ...], bool]:
+        """
+        Index a target document's element paths for _is_complex_element.
+
+        Only the first sibling with a given name is indexed (and descended into),
+        matching a first-match walk down from the root.
+
+        Args:
+            document: Target document structure with 'root' key
+
+        Returns:
+            Mapping of path (tuple of element names, root first) to whether that
+            element has non-empty children
+        """
+        index = {}
+        root = document.get('root') if document else None
+        if not isinstance(root, dict):
+            return index
+
+        root_path = (root.get('N'),)
+        index[root_path] = bool(root.get('C'))
+        stack = [(root_path, root)]
+        while stack:
+            path, node = stack.pop()
+            for child in node.get('C') or ():
+                child_path = path + (child.get('N'),)
+                if child_path in index:
+                    continue
+                index[child_path] = bool(child.get('C'))
+                stack.append((child_path, child))
+        return index
+
+    def _is_complex_element(self, path_index: Dict[Tuple[Any, ...], bool], target_path: str) -> bool:
         """
         Check if a target path refers to a complex element (has children).
 
@@ -849,43 +1013,16 @@ class JPKTransformationConverter:
         should have direct value mappings.
 
         Args:
-            document: Target document structure with 'root' key
+            path_index: Index of the target document from _build_path_index
             target_path: Slash-separated path like 'Contacts/Contact/ID/typID'
 
         Returns:
             True if the path refers to a complex element with children
+            (False if the path does not exist)
         """
-        if not document or 'root' not in document:
-            return False
-
-        # Parse the path
-        parts = target_path.split('/') if target_path else []
-        if not parts:
-            return False
-
-        # Navigate through the document structure
-        current = document.get('root', {})
-
-        # First part should match the root element name
-        if parts[0] != current.get('N'):
+        if not target_path:
             return False
-
-        # Navigate through remaining path parts
-        for part in parts[1:]:
-            children = current.get('C', [])
-            found = False
-            for child in children:
-                if child.get('N') == part:
-                    current = child
-                    found = True
-                    break
-            if not found:
-                # Path not found - return False (not complex, just doesn't exist)
-                return False
-
-        # Check if current node has non-empty children
-        children = current.get('C', [])
-        return len(children) > 0
+        return path_index.get(tuple(target_path.split('/')), False)
 
     def _convert_mapping_rules(self, jpk_mappings: List[Dict[str, Any]], target_schema: Dict[str, Any] = None, flat_field_names: List[str] = None) -> List[Dict[str, Any]]:
         """
@@ -906,35 +1043,39 @@ class JPKTransformationConverter:
             List of mapping rules in Jitterbit JSON format
         """
         # Step 1: Convert all JPK mappings to JSON rules
-        converted_rules = []
+        existing_preconditions = []
+        field_mappings = []
         existing_precond_paths = set()
 
         # Check if target is a flat schema
         # Use rule-based flat schema detection
-        is_flat_schema = self._rule_is_flat_schema(target_schema) if target_schema else False
+        is_flat_schema = _rule_is_flat_schema(target_schema) if target_schema else False
 
         # Load target document for canonical schema validation
         # Canonical schemas use XSD files and may have complex elements that can't accept direct value mappings
         target_document = None
+        target_path_index = None
         if target_schema:
             target_root = target_schema.get('root', '')
             # Check if this is a canonical schema (namespace root)
             if target_root and target_root.startswith('{') and '}' in target_root:
                 # Try to load canonical schema from reference file
-                from pathlib import Path
-                schema_refs_dir = Path(__file__).parent.parent.parent / 'schema_references'
                 target_xml = target_schema.get('schema', '')
-                if target_xml and schema_refs_dir.exists():
-                    schema_base = target_xml.replace('.xsd', '').replace('.xml', '')
+                if target_xml and self._schema_refs_index:
+                    schema_base = _schema_file_base(target_xml)
                     ref_file = f"{schema_base}.json"
-                    ref_path = schema_refs_dir / ref_file
-                    if ref_path.exists():
+                    if ref_file in self._schema_refs_index:
                         try:
-                            import json as json_module
-                            with open(ref_path, 'r') as f:
-                                target_document = json_module.load(f)
+                            target_document = self._load_ref_document(ref_file)
                         except Exception:
                             pass
+                        else:
+                            # Index the target document once (per reference file) instead of
+                            # walking it for every mapping
+                            target_path_index = self._ref_path_indexes.get(ref_file)
+                            if target_path_index is None:
+                                target_path_index = self._build_path_index(target_document)
+                                self._ref_path_indexes[ref_file] = target_path_index
 
         for jpk_mapping in jpk_mappings:
             json_rule = self._convert_single_mapping(jpk_mapping, is_flat_schema=is_flat_schema, flat_field_names=flat_field_names)
@@ -942,30 +1083,31 @@ class JPKTransformationConverter:
             if json_rule is None:
                 continue
 
+            is_precondition = json_rule.get('isPreconditionScript')
+            target_path = json_rule.get('targetPath', '')
+
+            # Step 2 (same pass): Separate existing preconditions (with their depth, for the
+            # sort below) from field mappings
+            if is_precondition:
+                # Track existing precondition paths to avoid duplicates
+                existing_precond_paths.add(target_path)
+                existing_preconditions.append((target_path.count('/'), json_rule))
+                continue
+
             # CRITICAL: Skip mappings that target complex elements (non-leaf nodes)
             # These mappings would fail in Integration Studio with "non-existent target field" error
-            if target_document and not json_rule.get('isPreconditionScript'):
-                target_path = json_rule.get('targetPath', '')
-                if target_path and self._is_complex_element(target_document, target_path):
-                    print(f"         ⚠️ Skipping mapping to complex element: {target_path}")
-                    continue
+            if target_document and target_path and self._is_complex_element(target_path_index, target_path):
+                print(f"         ⚠️ Skipping mapping to complex element: {target_path}")
+                continue
 
-            converted_rules.append(json_rule)
-            
-            # Track existing precondition paths to avoid duplicates
-            if json_rule.get('isPreconditionScript'):
-                existing_precond_paths.add(json_rule.get('targetPath', ''))
-        
-        # Step 2: Separate existing preconditions from field mappings
-        existing_preconditions = [r for r in converted_rules if r.get('isPreconditionScript')]
-        field_mappings = [r for r in converted_rules if not r.get('isPreconditionScript')]
+            field_mappings.append(json_rule)
         
         # Step 3: Generate intermediate preconditions from field mappings
         # These are the preconditions for parent paths that are NOT already covered
         # CRITICAL: Skip precondition generation for flat schemas (using rule)
         # Flat schemas don't need structure preconditions
         # Pass is_flat_schema flag to the rule function
-        should_skip = self._rule_should_skip_precondition(field_mappings) if field_mappings else False
+        should_skip = _rule_should_skip_precondition(field_mappings) if field_mappings else False
         if not should_skip:
             intermediate_preconditions = self._generate_intermediate_preconditions(
                 field_mappings, 
@@ -974,12 +1116,14 @@ class JPKTransformationConverter:
         else:
             intermediate_preconditions = []
         
-        # Step 4: Combine all preconditions (existing + intermediate) and sort by depth
-        all_preconditions = existing_preconditions + intermediate_preconditions
-        all_preconditions.sort(key=lambda r: r.get('targetPath', '').count('/'))
+        # Step 4: Combine all preconditions (existing + intermediate) and sort by depth (stable)
+        all_preconditions = existing_preconditions + [
+            (rule.get('targetPath', '').count('/'), rule) for rule in intermediate_preconditions
+        ]
+        all_preconditions.sort(key=itemgetter(0))
         
         # Step 5: Final result: preconditions first (sorted by depth), then field mappings
-        final_rules = all_preconditions + field_mappings
+        final_rules = [rule for _, rule in all_preconditions] + field_mappings
         
         return final_rules
     
@@ -1003,40 +1147,33 @@ class JPKTransformationConverter:
         if not jpk_mappings:
             return []
         
-        # Collect all loop patterns found in mappings
-        loop_candidates = []
-        
-        # Scan through mappings to find loop patterns
+        # Scan through mappings for loop patterns, keeping the shallowest target loop
+        # (top-level, not nested); the first one wins on equal depth
+        best_depth = None
+        tgt_loop_path = src_loop_path = None
         for jpk_mapping in jpk_mappings:
             target_path_raw = jpk_mapping.get('target_path', '')
-            source_expression = jpk_mapping.get('source_expression', '')
             
             # Check if this mapping has a loop pattern (ends with '.]')
             if target_path_raw.endswith('.]'):
                 # Extract the loop path by removing the brackets
                 tgt_loop_path_candidate = target_path_raw.strip('[]')
-                src_loop_path_candidate = source_expression.strip('[]')
                 
                 # Count depth by number of $ symbols to find the top-level loop
                 tgt_depth = tgt_loop_path_candidate.count('$')
                 
-                loop_candidates.append({
-                    'tgt_loop': tgt_loop_path_candidate,
-                    'src_loop': src_loop_path_candidate,
-                    'tgt_depth': tgt_depth
-                })
+                if best_depth is None or tgt_depth < best_depth:
+                    best_depth = tgt_depth
+                    tgt_loop_path = tgt_loop_path_candidate
+                    src_loop_path = jpk_mapping.get('source_expression', '').strip('[]')
+                    if tgt_depth == 0:
+                        # Can't get any shallower
+                        break
         
         # No loop patterns found
-        if not loop_candidates:
+        if best_depth is None:
             return []
         
-        # Find the shallowest target loop (top-level, not nested)
-        # Sort by depth and take the first one (shallowest)
-        main_loop = min(loop_candidates, key=lambda x: x['tgt_depth'])
-        
-        tgt_loop_path = main_loop['tgt_loop']
-        src_loop_path = main_loop['src_loop']
-        
         # Generate the path versions (replace $ with /)
         # Remove trailing dot for path version
         tgt_path = tgt_loop_path.rstrip('.').replace('$', '/')
@@ -1045,21 +1182,19 @@ class JPKTransformationConverter:
         # This ensures canonical schema roots (like "Contacts") are translated to runtime roots (like "records")
         # when the target schema is Salesforce-origin
         # Check if translation should be applied based on target schema root
-        skip_translation = self._rule_should_skip_root_translation(
+        skip_translation = _rule_should_skip_root_translation(
             self._current_target_root,
             self._current_salesforce_object_name
         )
 
         if not skip_translation:
             # Apply translation to tgtLoopPath and tgtPath
-            for canonical, runtime in self._salesforce_root_translations.items():
-                canonical_loop = f"{canonical}$"
-                runtime_loop = f"{runtime}$"
+            for canonical_loop, runtime_loop, canonical_path, runtime_path in _SALESFORCE_LOOP_PREFIXES:
                 if tgt_loop_path.startswith(canonical_loop):
                     tgt_loop_path = runtime_loop + tgt_loop_path[len(canonical_loop):]
 
-                if tgt_path.startswith(f"{canonical}/"):
-                    tgt_path = f"{runtime}/" + tgt_path[len(canonical)+1:]
+                if tgt_path.startswith(canonical_path):
+                    tgt_path = runtime_path + tgt_path[len(canonical_path):]
 
         # CRITICAL FIX: srcPath should be empty string to match baseline pattern
         # The source loop path is already in srcLoopPath; srcPath being empty is expected
@@ -1106,7 +1241,7 @@ class JPKTransformationConverter:
         # CRITICAL FIX 2: Map "data" → "__flat__/{actual_field}" for flat schemas (using rule)
         # Pass flat_field_names to use actual JPK field names when USE_JPK_FLAT_FIELD_NAMES=True
         if is_flat_schema:
-            mapped_target = self._rule_map_flat_target_path(cleaned_target, flat_field_names)
+            mapped_target = _rule_map_flat_target_path(cleaned_target, flat_field_names)
             if mapped_target != cleaned_target:
                 target_path_raw = mapped_target
                 cleaned_target = mapped_target
@@ -1124,8 +1259,8 @@ class JPKTransformationConverter:
         # e.g., "invoices//PRESCRIPT/" → precondition for "invoices" root
         if '/PRESCRIPT/' in target_path or '/PRESCRIPT' in target_path:
             # Strip the PRESCRIPT part - target the parent element
-            target_path = re.sub(r'//PRESCRIPT/?$', '', target_path)
-            target_path = re.sub(r'/PRESCRIPT/?$', '', target_path)
+            target_path = _PRESCRIPT_DOUBLE_SLASH_SUFFIX_RE.sub('', target_path)
+            target_path = _PRESCRIPT_SUFFIX_RE.sub('', target_path)
             # If the script has actual content (not just structure), it becomes a precondition script
             if has_script and source_expression.strip():
                 is_precondition = True
@@ -1141,7 +1276,7 @@ class JPKTransformationConverter:
             # CRITICAL: Pass for_target=True since this is for the target path
             # Also strip PRESCRIPT from targetScript
             script_raw = target_path_raw.strip('[]')
-            script_raw = re.sub(r'\$?/PRESCRIPT/?$', '$', script_raw)
+            script_raw = _PRESCRIPT_SCRIPT_SUFFIX_RE.sub('$', script_raw)
             target_script = self._translate_jpk_root(script_raw, for_target=True)
         
         # CRITICAL FIX 3 & 4: For mappings with scripts, preserve full script and extract srcPaths from it
@@ -1149,11 +1284,9 @@ class JPKTransformationConverter:
             # Preserve the full transformScript from JPK (source_expression contains the full script)
             # Remove <trans> tags if present (we'll add them back)
             script_content = source_expression.strip()
-            if script_content.startswith('<trans>'):
-                script_content = script_content[7:]  # Remove '<trans>'
-            if script_content.endswith('</trans>'):
-                script_content = script_content[:-8]  # Remove '</trans>'
-            script_content = script_content.strip()
+            start = 7 if script_content.startswith('<trans>') else 0  # Remove '<trans>'
+            end = -8 if script_content.endswith('</trans>') else None  # Remove '</trans>'
+            script_content = script_content[start:end].strip()
             
             # Format with <trans> tags
             transform_script = self._format_transform_script(script_content)
@@ -1260,13 +1393,13 @@ class JPKTransformationConverter:
         # containing slashes. Integration Studio expects the path to include these slashes.
         # Only clean truly redundant slashes (3+ consecutive slashes to 2)
         if '///' in path:
-            path = re.sub(r'//{3,}', '//', path)
+            path = _EXTRA_SLASHES_RE.sub('//', path)
 
         # Apply canonical → runtime schema root translation ONLY for Salesforce-origin schemas
         # Use JPK-driven rule to determine if translation should be skipped
         # CRITICAL: For target paths, check the TARGET schema root, not the source
         schema_root = self._current_target_root if for_target else self._current_source_root
-        skip_translation = self._rule_should_skip_root_translation(
+        skip_translation = _rule_should_skip_root_translation(
             schema_root,
             self._current_salesforce_object_name
         )
@@ -1274,8 +1407,8 @@ class JPKTransformationConverter:
         if not skip_translation:
             # Only apply translation for Salesforce-origin schemas
             segments = path.split('/')
-            if segments and segments[0] in self._salesforce_root_translations:
-                segments[0] = self._salesforce_root_translations[segments[0]]
+            if segments and segments[0] in SALESFORCE_ROOT_TRANSLATIONS:
+                segments[0] = SALESFORCE_ROOT_TRANSLATIONS[segments[0]]
                 path = '/'.join(segments)
 
         return path
@@ -1295,10 +1428,14 @@ class JPKTransformationConverter:
             for_target: If True, this is for a target path (check target root)
                        If False, this is for a source path (check source root)
         """
+        # Most scripts don't start with a canonical root - nothing to translate either way
+        if not jpk_script.startswith(_CANONICAL_SCRIPT_PREFIXES):
+            return jpk_script
+
         # Check if translation should be skipped (for true canonical schemas with namespace)
         # CRITICAL: For target paths, check the TARGET schema root, not the source
         schema_root = self._current_target_root if for_target else self._current_source_root
-        skip_translation = self._rule_should_skip_root_translation(
+        skip_translation = _rule_should_skip_root_translation(
             schema_root,
             self._current_salesforce_object_name
         )
@@ -1307,12 +1444,7 @@ class JPKTransformationConverter:
             return jpk_script
 
         # Canonical → Runtime root mapping (only for Salesforce-origin schemas)
-        CANONICAL_TO_RUNTIME = {
-            'Contacts$': 'records$',
-            'Contacts.': 'records.',
-        }
-
-        for canonical, runtime in CANONICAL_TO_RUNTIME.items():
+        for canonical, runtime in _CANONICAL_TO_RUNTIME_SCRIPT_PREFIXES:
             if jpk_script.startswith(canonical):
                 return runtime + jpk_script[len(canonical):]
 
@@ -1336,16 +1468,13 @@ class JPKTransformationConverter:
         Returns:
             List of unique source schema field paths
         """
-        import re
-        
         if not script_content:
             return []
         
         # Find all jbroot$... paths in the script
         # Pattern: jbroot$ followed by field path segments separated by $ or .
         # Also handle #. for array access
-        pattern = r'jbroot\$[^\s\)\;\+\=]+'
-        matches = re.findall(pattern, script_content)
+        matches = _JBROOT_PATH_RE.findall(script_content)
         
         if not matches:
             return []
@@ -1382,7 +1511,7 @@ class JPKTransformationConverter:
                 if seg.isdigit():
                     # Use rule-based heuristic to determine if numeric segment should be kept
                     next_seg = path_segments[i + 1] if i + 1 < len(path_segments) else None
-                    if self._rule_should_keep_numeric_segment(seg, next_seg):
+                    if _rule_should_keep_numeric_segment(seg, next_seg):
                         filtered_segments.append(seg)
                     # Otherwise, it's an array index - skip it
                 else:
@@ -1424,8 +1553,6 @@ class JPKTransformationConverter:
         Returns:
             List of source schema field paths (empty list for variable references)
         """
-        import re
-        
         if not expression:
             return []
         
@@ -1435,7 +1562,7 @@ class JPKTransformationConverter:
         # CRITICAL FIX: Detect variable references FIRST, before any processing
         # Use centralized variable pattern from rules
         # Check the full expression first
-        if re.match(self._variable_pattern, expr):
+        if _VARIABLE_REFERENCE_RE.match(expr):
             return []
 
         # CRITICAL FIX: Detect literal string constants (quoted strings)
@@ -1455,12 +1582,12 @@ class JPKTransformationConverter:
             if last_line in ('true', 'false', 'null'):
                 return []
             # Numeric literals (integer or decimal)
-            if re.match(r'^-?\d+\.?\d*$', last_line):
+            if _NUMERIC_LITERAL_RE.match(last_line):
                 return []
             # CRITICAL FIX: Detect local variable references
             # Patterns like "sfId;" or "varName;" are local variable references, not source paths
             # Local vars: simple identifier followed by optional semicolon
-            if re.match(r'^[a-z][a-zA-Z0-9_]*;?$', last_line):
+            if _LOCAL_VARIABLE_RE.match(last_line):
                 return []
 
         # CRITICAL FIX: If expression starts with // it's a comment, not a path
@@ -1480,7 +1607,7 @@ class JPKTransformationConverter:
         
         # Check if source_part is a variable reference (starts and ends with $)
         # Also check if it's just a variable name without $ delimiters but matches variable pattern
-        if re.match(self._variable_pattern, source_part):
+        if _VARIABLE_REFERENCE_RE.match(source_part):
             return []
         
         # Additional check: if source_part starts and ends with $ and has no field separators
@@ -1493,7 +1620,7 @@ class JPKTransformationConverter:
         
         # CRITICAL FIX: Split on $, ., and # (array index marker)
         # This handles patterns like statusDetail#1.message where #1 is an array index
-        segments = re.split(r'[\$\.#]', source_part)
+        segments = _SOURCE_SEGMENT_SEPARATOR_RE.split(source_part)
         
         # Filter out empty segments
         segments = [s for s in segments if s]
@@ -1508,7 +1635,7 @@ class JPKTransformationConverter:
         if has_navigation:
             # WITH navigation prefix: strip all navigation INCLUDING 'records'
             # Use centralized navigation prefixes and collection roots from rules
-            full_nav_prefixes = self._navigation_prefixes + self._collection_roots
+            full_nav_prefixes = NAVIGATION_PREFIXES + COLLECTION_ROOTS
             
             schema_start_idx = 0
             for i, seg in enumerate(segments):
@@ -1542,7 +1669,7 @@ class JPKTransformationConverter:
             if (single_segment and 
                 single_segment[0].isupper() and 
                 '_' in single_segment and
-                re.match(r'^[A-Za-z_][A-Za-z0-9_]*$', single_segment)):
+                _IDENTIFIER_RE.match(single_segment)):
                 # This looks like a variable name, not a source field path
                 return []
         
@@ -1586,8 +1713,6 @@ class JPKTransformationConverter:
         Returns:
             Just the field reference portion for transformScript
         """
-        import re
-        
         if not expression:
             return ''
         
@@ -1612,7 +1737,7 @@ class JPKTransformationConverter:
             
             # If no semicolon, extract the field reference from the function argument
             # Pattern: function_name(field_reference)
-            match = re.search(r'\(([^()]+)\)\s*$', expr)
+            match = _TRAILING_CALL_ARGUMENT_RE.search(expr)
             if match:
                 return match.group(1).strip().rstrip('.$') + '$'
         
@@ -1638,12 +1763,13 @@ class JPKTransformationConverter:
     
     def _generate_guid(self, seed: str) -> str:
         """Generate deterministic GUID from seed value."""
-        if seed in self.guid_cache:
+        try:
             return self.guid_cache[seed]
-        
+        except KeyError:
+            pass
+
         # Use UUID5 for deterministic generation
-        namespace = uuid.UUID('a3bb189e-8bf9-3888-9912-ace4e6543002')
-        guid = str(uuid.uuid5(namespace, seed))
+        guid = str(uuid.uuid5(_GUID_NAMESPACE, seed))
         self.guid_cache[seed] = guid
         return guid
     
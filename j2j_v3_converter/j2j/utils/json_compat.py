@@ -0,0 +1,46 @@
+"""
+JSON helpers for J2J v327.
+
+orjson is an optional accelerator: when it is installed these helpers use it,
+otherwise they fall back to the standard library json module. Callers import
+from here instead of guarding the orjson import themselves.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_json_bytes(data: Union[bytes, str]) -> Any:
+    """
+    Parse a JSON document.
+
+    Args:
+        data: Raw JSON document (bytes or str)
+
+    Returns:
+        Parsed JSON value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_json_compact(obj: Any, output_path: str) -> None:
+    """
+    Write a JSON document to a file without whitespace between tokens.
+
+    Args:
+        obj: JSON-serializable value
+        output_path: Path of the file to write
+    """
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(obj, f, separators=(',', ':'))
@@ -76,6 +76,19 @@ class TraceLogger:
         self.entries: List[Dict[str, Any]] = []
         self.start_time = datetime.now()
     
+    def accepts(self, verbosity_required: VerbosityLevel) -> bool:
+        """Check whether an entry at the given verbosity would be recorded.
+        
+        Lets callers skip building expensive context dicts for entries that would be dropped.
+        
+        Args:
+            verbosity_required: Minimum verbosity level required by the entry
+            
+        Returns:
+            True if logging is enabled and the verbosity level is high enough
+        """
+        return self.enabled and verbosity_required.value <= self.verbosity.value
+    
     def log_decision(
         self,
         decision: str,
@@ -89,7 +102,7 @@ class TraceLogger:
             context: Additional context data
             verbosity_required: Minimum verbosity level required to log this entry
         """
-        if not self.enabled or verbosity_required.value > self.verbosity.value:
+        if not self.accepts(verbosity_required):
             return
         
         self.entries.append({
@@ -113,7 +126,7 @@ class TraceLogger:
             source_data: The actual source data
             verbosity_required: Minimum verbosity level required to log this entry
         """
-        if not self.enabled or verbosity_required.value > self.verbosity.value:
+        if not self.accepts(verbosity_required):
             return
         
         self.entries.append({
@@ -137,7 +150,7 @@ class TraceLogger:
             context: Additional context data
             verbosity_required: Minimum verbosity level required to log this entry
         """
-        if not self.enabled or verbosity_required.value > self.verbosity.value:
+        if not self.accepts(verbosity_required):
             return
         
         self.entries.append({
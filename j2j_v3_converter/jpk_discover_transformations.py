@@ -1499,6 +1499,24 @@ def get_target_type_name(type_id):
     return type_mapping.get(type_id, f'Unknown ({type_id})')
 
 
+def build_discovery_output(jpk_path):
+    """
+    Discover transformations and wrap them in the discovery output document.
+
+    Args:
+        jpk_path: Path to the JPK file
+
+    Returns:
+        Dictionary with jpk_file, transformation_count and transformations
+    """
+    transformations = discover_transformations(jpk_path)
+    return {
+        "jpk_file": jpk_path,
+        "transformation_count": len(transformations),
+        "transformations": transformations
+    }
+
+
 def main():
     """Main entry point."""
     if len(sys.argv) < 2:
@@ -1517,17 +1535,10 @@ def main():
 
     print(f"🔍 Discovering transformations in: {jpk_path}\n")
 
-    transformations = discover_transformations(jpk_path)
+    output = build_discovery_output(jpk_path)
 
     print(f"\n📊 Discovery Summary:")
-    print(f"   Total transformations found: {len(transformations)}")
-
-    # Prepare output
-    output = {
-        "jpk_file": jpk_path,
-        "transformation_count": len(transformations),
-        "transformations": transformations
-    }
+    print(f"   Total transformations found: {output['transformation_count']}")
 
     # Write to file or stdout
     if output_path: